@@ -0,0 +1,21 @@
+bl_info = {
+    "name": "Pinguin",
+    "author": "Jorge Rodriguez <jorgeandresarq+dev@gmail.com>",
+    "version": (3, 5, 0),
+    "blender": (3, 6, 0),
+    "location": "Operator Search",
+    "description": "Takes cutout images(png format) and turns them into a mesh in the 3D Space",
+    "warning": "",
+    "doc_url": "",
+    "category": "Add Mesh",
+}
+
+### The add-on is a package: its Blender side (operators, panels, CLI) in addon.py and the bpy-free pipeline in core
+### outside Blender (tests, benchmarks, worker processes) only Pinguin_bl.core is used and bpy is never asked for
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+if bpy is not None:
+    from .addon import convert_directory, main, register, unregister
@@ -0,0 +1,14 @@
+### Command line batches: blender -b -P Pinguin_bl/__main__.py -- <directories> [options] (see main in addon.py)
+### the add-on is imported as the Pinguin_bl package, from the folder holding it (a checkout or the add-ons folder)
+import os
+import sys
+
+# Worker processes import this file again under another name, only the script run by Blender starts a batch
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import Pinguin_bl
+
+    Pinguin_bl.register()
+    # Arguments after "--" are Pinguin's own
+    if "--" in sys.argv:
+        sys.exit(Pinguin_bl.main(sys.argv[sys.argv.index("--") + 1:]))
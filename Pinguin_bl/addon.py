@@ -0,0 +1,1639 @@
+### Pinguin's Blender side: properties, operators, panels, mesh and material creation and the command line batches
+### everything before the mesh (decode, contours, triangulation) is in the core subpackage, which never imports bpy
+
+### Imports all needed modules
+import bpy
+import sys  
+import os
+import argparse
+import subprocess
+import time
+import math
+import json
+import logging
+import importlib
+import importlib.util
+from mathutils import (Vector, Quaternion)
+
+### Pure python pipeline (no bpy), the core subpackage of the add-on
+from .core import (Image, PipelineProfiler, ShelfPacker, atlas_padding, atlas_uv_transform, configure_logger,
+                          cross_product_3d, cutout_object_is_current, cutout_settings_hash, cv, flip_vector,
+                          image_png_paths, item_log, iter_cutouts, lod_level_for_distance, logger, normalize_vector, np,
+                          null_profiler, project_vector_onto_plane, proxy_texture_path, prune_cutout_cache,
+                          save_proxy_textures)
+from bpy_extras.io_utils import ExportHelper
+
+### DEPENDENCIES ###
+# pillow, opencv, numpy are non-preinstalled blender libraries, they are never installed while the add-on loads,
+# only from the "Install dependencies" operator (add-on preferences or Create panel)
+# (module name, pip package name)
+pinguin_dependencies = [("PIL", "Pillow"),
+                        ("cv2", "opencv-python"),
+                        ("numpy", "numpy")]
+dependencies_cache_file = "pinguin_dependencies.json"
+# Per session copy of the disk cache so panels can check it on every redraw
+dependencies_status = {}
+
+### PROFILER ###
+# Profiler of the last profiled conversion of the session, shown in the Profile panel until the next one
+last_profile = {"profiler": None}
+
+### def_imports the non-preinstalled modules, called when a conversion starts
+def load_dependencies():
+    for lazy_module in (Image, cv, np):
+        lazy_module.load_module()
+
+### def_key of the dependency cache, each blender python keeps its own site-packages
+def dependencies_cache_key():
+    python_version = sys.version.split()[0]
+    return f"{python_version} {sys.executable}"
+
+### def_path of the json file where the dependency check is stored between sessions
+def dependencies_cache_path():
+    config_directory = bpy.utils.user_resource('CONFIG', path="pinguin", create=True)
+    return os.path.join(config_directory, dependencies_cache_file)
+
+def read_dependencies_cache():
+    try:
+        with open(dependencies_cache_path()) as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+def write_dependencies_cache(cache):
+    try:
+        with open(dependencies_cache_path(), "w") as cache_file:
+            json.dump(cache, cache_file, indent=4)
+    except OSError:
+        # Read only config folder, the check just runs again next session
+        pass
+
+### def_returns the pip packages missing in blender's python
+### a complete install is trusted from the disk cache, anything else is checked again with find_spec (no imports)
+def missing_dependencies(refresh=False):
+    cache_key = dependencies_cache_key()
+    if not refresh and cache_key in dependencies_status:
+        return dependencies_status[cache_key]
+
+    cache = read_dependencies_cache()
+    if not refresh and cache.get(cache_key) == []:
+        missing = []
+    else:
+        missing = []
+        for module_name, package_name in pinguin_dependencies:
+            if importlib.util.find_spec(module_name) is None:
+                missing.append(package_name)
+        cache[cache_key] = missing
+        write_dependencies_cache(cache)
+
+    dependencies_status[cache_key] = missing
+    return missing
+
+### def_installs the given pip packages with blender's python, only called from PREFERENCES_OT_pinguin_install_dependencies
+def install_dependencies(packages):
+    # Some blender builds ship without pip
+    if importlib.util.find_spec("pip") is None:
+        subprocess.check_call([sys.executable, '-m', 'ensurepip', '--upgrade'])
+    subprocess.check_call([sys.executable, '-m', 'pip', 'install', '--upgrade', 'pip'])
+    subprocess.check_call([sys.executable, '-m', 'pip', 'install', *packages])
+
+    importlib.invalidate_caches()
+    missing_dependencies(refresh=True)
+
+### ERRRORS ###
+class NotFacingTowardsError(Exception):
+    "Raised when the tilt operation is "
+    pass
+
+class PerpendicularOrientError(Exception):
+    "Raised when the tilt operation is "
+    pass
+
+### PROPERTIES ###
+class PinguinProperties(bpy.types.PropertyGroup):
+
+    pinguin_folder :  bpy.props.StringProperty(
+        subtype='DIR_PATH',
+        name='',
+        description = "Folder where cut-out images are located, only images in .png format will be converted", 
+        default="Cutouts directory"
+        )
+    
+    pinguin_mesh_height : bpy.props.FloatProperty(
+        name = "Mesh Heigth", 
+        description="Mesh target height",
+        default=1.7,
+        min=0.001, soft_max=10
+        )
+    
+    pinguin_vertical_orient : bpy.props.BoolProperty(
+        name = "Vertical", 
+        description="Toogle to stand up the meshes",
+        default=True
+        )
+    
+    pinguin_holes : bpy.props.BoolProperty(
+        name = "Holes", 
+        description="Toogle to create a mesh with holes",
+        default=False
+        )
+    
+    
+    pinguin_sync : bpy.props.BoolProperty(
+        name = "Sync", 
+        description="Update the cutouts already converted from this folder instead of duplicating them: only changed pngs are rebuilt and objects whose png is gone are removed",
+        default=False
+        )
+    
+    pinguin_crop : bpy.props.BoolProperty(
+        name = "Crop", 
+        description="Load textures cropped to the cutout (written in a 'Cropped' folder) instead of the whole png with its transparent margins",
+        default=False
+        )
+    
+    pinguin_proxy_sizes : bpy.props.EnumProperty(
+        name = "Proxies",
+        description = "Downscaled copies of every texture written in a 'Proxies' folder next to it, swap to them to keep the viewport fast",
+        items = [("512","512",""),
+                ("1024","1K",""),
+                ("2048","2K","")],
+        options = {"ENUM_FLAG"},
+        default = set()
+        )
+    
+    pinguin_atlas : bpy.props.BoolProperty(
+        name = "Atlas", 
+        description="Pack the cutouts into a few shared atlas textures (written in an 'Atlas' folder) instead of one image and material each",
+        default=False
+        )
+    
+    pinguin_atlas_size : bpy.props.EnumProperty(
+        name = "Atlas Size",
+        description = "Width and height in pixels of each atlas page",
+        items = [("2048","2K",""),
+                ("4096","4K",""),
+                ("8192","8K","")],
+        default = "4096"
+        )
+    
+    pinguin_cache : bpy.props.BoolProperty(
+        name = "Cache", 
+        description="Store the processed contours in a 'Contour Cache' folder so unchanged cutouts are not decoded again",
+        default=True
+        )
+    
+    pinguin_alpha_masks : bpy.props.BoolProperty(
+        name = "Save Masks", 
+        description="Also write the alpha channel masks as pngs in the 'Alpha Channel' folder, only useful for debugging",
+        default=False
+        )
+    
+    pinguin_smooth_window : bpy.props.IntProperty(
+        name = "Smooth", 
+        description="Number of contour points averaged together to smooth the silhouette, 1 disables smoothing",
+        default=3,
+        min=1, soft_max=15
+        )
+    
+    pinguin_smooth_kernel : bpy.props.EnumProperty(
+        name = "Smooth Kernel",
+        description = "Weights of the smoothing average",
+        items = [("BOX","Box","Every point in the window weights the same"),
+                ("GAUSSIAN","Gaussian","Points in the middle of the window weight more")],
+        default = "BOX"
+        )
+    
+    pinguin_simplify_error : bpy.props.FloatProperty(
+        name = "Simplify", 
+        description="Largest distance the simplified contours may move away from the original ones, 0 disables simplification",
+        default=0.0,
+        min=0.0, soft_max=0.05,
+        precision=4,
+        subtype='DISTANCE'
+        )
+    
+    pinguin_vertex_budget : bpy.props.IntProperty(
+        name = "Max Vertices", 
+        description="Contour vertices allowed per cutout, the contours are simplified further until they fit, 0 means no limit",
+        default=0,
+        min=0, soft_max=5000
+        )
+    
+    pinguin_lod_levels : bpy.props.IntProperty(
+        name = "LODs", 
+        description="Simplified levels of detail made for every cutout besides the full mesh, 0 disables them",
+        default=0,
+        min=0, max=4
+        )
+    
+    pinguin_lod_error : bpy.props.FloatProperty(
+        name = "LOD Error", 
+        description="Simplification distance of the first LOD, every next level allows 4 times more",
+        default=0.005,
+        min=0.0001, soft_max=0.1,
+        precision=4,
+        subtype='DISTANCE'
+        )
+    
+    pinguin_profile : bpy.props.BoolProperty(
+        name = "Profile", 
+        description="Time every stage of every image and count what was made, see the Profile panel after converting",
+        default=False
+        )
+    
+    pinguin_lod_distance : bpy.props.FloatProperty(
+        name = "LOD Distance", 
+        description="Camera distance where cutouts switch to their first LOD, the next levels start every time the distance doubles",
+        default=10.0,
+        min=0.01, soft_max=100,
+        subtype='DISTANCE'
+        )
+    
+    pinguin_workers : bpy.props.IntProperty(
+        name = "Workers", 
+        description="Number of images processed at the same time, 0 uses all the processor cores",
+        default=0,
+        min=0, soft_max=64
+        )
+    
+    pinguin_worker_pool : bpy.props.EnumProperty(
+        name = "Worker Pool",
+        description = "What the workers run in",
+        items = [("thread","Threads","Workers share Blender's process and its scanfill, the fastest triangulation"),
+                ("process","Processes","Every worker is a process of its own, without Blender's scanfill they triangulate with the slower bundled earcut")],
+        default = "thread"
+        )
+    
+    pinguin_cv_algorithm : bpy.props.EnumProperty(
+        name = "Contour Algorithm",
+        description = "Set the contour search algorithm between a fast one or a presice one",
+        items = [("SIMPLE","Fast",""),
+                ("NONE","Detailed","")],
+        options = {"ENUM_FLAG"},
+        default = {"SIMPLE"}
+        )
+    
+    pinguin_face_target_object : bpy.props.PointerProperty(
+        name = "Target",
+        description = "Set the contour search algorithm between a fast one or a presice one",
+        options={'ANIMATABLE'},
+        type=bpy.types.Object,
+    )
+
+    pinguin_face_target_tilt : bpy.props.BoolProperty(
+        name = "Tilt", 
+        description="Enable tilt in alignment",
+        default=False
+        )
+
+### PREFERENCES ###
+### def_applies the Log preference, also called from register so a new session starts with it
+def update_log_level(self, context):
+    configure_logger(self.log_level)
+
+class PinguinPreferences(bpy.types.AddonPreferences):
+    bl_idname = __package__
+
+    log_level : bpy.props.EnumProperty(
+        name = "Log",
+        description = "Messages written to the system console while converting",
+        items = [("QUIET","Quiet","Warnings and errors only, nothing is written per cutout"),
+                ("INFO","Info","Progress, at most one message per second for each kind of per cutout message, and a summary per folder"),
+                ("DEBUG","Debug","Every cutout and the angles of the Face Towards operators")],
+        default = "INFO",
+        update = update_log_level
+        )
+
+    def draw(self, context):
+        col = self.layout.column()
+        col.prop(self, "log_level")
+        missing = missing_dependencies()
+        for module_name, package_name in pinguin_dependencies:
+            if package_name in missing:
+                col.label(text=f"{package_name} is not installed", icon="ERROR")
+            else:
+                col.label(text=f"{package_name} is installed", icon="CHECKMARK")
+        col.operator("preferences.pinguin_install_dependencies", icon="IMPORT")
+
+### OPERATORS ###
+class PREFERENCES_OT_pinguin_install_dependencies(bpy.types.Operator):
+    """Installs Pillow, Open-cv and Numpy into Blender's python (requires internet access)"""
+    bl_idname = "preferences.pinguin_install_dependencies"
+    bl_label = "Install dependencies"
+
+    def execute(self, context):
+        missing = missing_dependencies(refresh=True)
+        if not missing:
+            self.report({'INFO'}, "Pinguin dependencies are already installed")
+            return{"FINISHED"}
+
+        try:
+            install_dependencies(missing)
+        except subprocess.CalledProcessError as error:
+            self.report({'ERROR'}, f"Could not install {', '.join(missing)}: {error}")
+            return{"CANCELLED"}
+
+        self.report({'INFO'}, f"Installed {', '.join(missing)}")
+        return{"FINISHED"}
+
+class MESH_OT_pinguin_create(bpy.types.Operator):
+    """Converts some png cutouts into a mesh"""
+    bl_idname = "mesh.png_to_mesh"
+    bl_label = "Png to Mesh"
+    #bl_options = {'REGISTER', 'UNDO'}
+    ### Define Properties that will be appended to the variables
+
+    def execute(self, context):
+        
+        ### -1.Variable Assignment, the conversion itself runs without UI (see convert_directory)
+        my_tool = context.scene.my_tool
+        profiler = PipelineProfiler() if my_tool.pinguin_profile else None
+        try:
+            summary = convert_directory(my_tool.pinguin_folder,
+                                        mesh_height=my_tool.pinguin_mesh_height,
+                                        orient_vertical=my_tool.pinguin_vertical_orient,
+                                        holes=my_tool.pinguin_holes,
+                                        algorithm=my_tool.pinguin_cv_algorithm,
+                                        workers=my_tool.pinguin_workers,
+                                        pool=my_tool.pinguin_worker_pool,
+                                        smooth_window=my_tool.pinguin_smooth_window,
+                                        smooth_kernel=my_tool.pinguin_smooth_kernel,
+                                        simplify_error=my_tool.pinguin_simplify_error,
+                                        vertex_budget=my_tool.pinguin_vertex_budget,
+                                        lod_levels=my_tool.pinguin_lod_levels,
+                                        lod_error=my_tool.pinguin_lod_error,
+                                        sync=my_tool.pinguin_sync,
+                                        cache=my_tool.pinguin_cache,
+                                        crop=my_tool.pinguin_crop,
+                                        atlas=my_tool.pinguin_atlas,
+                                        atlas_size=int(my_tool.pinguin_atlas_size),
+                                        proxy_sizes=[int(size) for size in my_tool.pinguin_proxy_sizes],
+                                        save_alpha_masks=my_tool.pinguin_alpha_masks,
+                                        profiler=profiler)
+        except ImportError as error:
+            self.report({'ERROR'}, str(error))
+            return{"CANCELLED"}
+
+        if profiler is not None:
+            last_profile["profiler"] = profiler
+
+        if summary["contour_vertices"] != summary["mesh_vertices"]:
+            self.report({'INFO'}, f"Simplified from {summary['contour_vertices']} to {summary['mesh_vertices']} contour vertices")
+        if summary["reused_images"]:
+            self.report({'INFO'}, f"{summary['reused_images']} images reused instead of loaded again, {summary['saved_bytes'] / 2**20:.1f} MB saved")
+        return{"FINISHED"}
+
+class MATERIAL_OT_pinguin_swap_textures(bpy.types.Operator):
+    """Swaps the textures of every Pinguin material between the full resolution pngs and their proxies"""
+    bl_idname = "material.pinguin_swap_textures"
+    bl_label = "Swap Textures"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    resolution : bpy.props.EnumProperty(
+        name = "Resolution",
+        description = "Textures used by the Pinguin materials, proxies keep the viewport fast and full resolution is for rendering",
+        items = [("FULL","Full Resolution","Original textures, use them before rendering"),
+                ("2048","2K Proxies",""),
+                ("1024","1K Proxies",""),
+                ("512","512 Proxies","")],
+        default = "FULL"
+        )
+
+    def execute(self, context):
+        swapped_materials = 0
+        missing_proxies = 0
+        for mat in bpy.data.materials:
+            texture_path = mat.get("pinguin_texture")
+            if texture_path is None or not mat.use_nodes:
+                continue
+            
+            target_path = texture_path
+            if self.resolution != "FULL":
+                target_path = proxy_texture_path(texture_path, int(self.resolution))
+                if not os.path.exists(bpy.path.abspath(target_path)):
+                    missing_proxies += 1
+                    continue
+            
+            for node in mat.node_tree.nodes:
+                if node.type != "TEX_IMAGE":
+                    continue
+                old_image = node.image
+                node.image = bpy.data.images.load(target_path, check_existing=True)
+                # Frees the pixels of the resolution that is no longer used
+                if old_image is not None and old_image != node.image and old_image.users == 0:
+                    bpy.data.images.remove(old_image)
+            swapped_materials += 1
+
+        if missing_proxies:
+            self.report({'WARNING'}, f"{swapped_materials} materials swapped, {missing_proxies} have no {self.resolution} proxy (enable it in Proxies and convert again)")
+        else:
+            self.report({'INFO'}, f"{swapped_materials} materials swapped")
+        return{"FINISHED"}
+
+class WM_OT_pinguin_export_profile(bpy.types.Operator, ExportHelper):
+    """Saves the profile of the last conversion as json or as a Chrome trace (chrome://tracing, ui.perfetto.dev)"""
+    bl_idname = "wm.pinguin_export_profile"
+    bl_label = "Export Profile"
+
+    filename_ext = ".json"
+    filter_glob : bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+
+    profile_format : bpy.props.EnumProperty(
+        name = "Format",
+        description = "Plain json with the totals and every stage, or the Trace Event Format of Chrome and Perfetto",
+        items = [("JSON","Json",""),
+                ("CHROME","Chrome Trace","")],
+        default = "JSON"
+        )
+
+    @classmethod
+    def poll(cls, context):
+        return last_profile["profiler"] is not None
+
+    def execute(self, context):
+        try:
+            last_profile["profiler"].write(self.filepath, chrome_trace=self.profile_format == "CHROME")
+        except OSError as error:
+            self.report({'ERROR'}, f"Could not write the profile: {error}")
+            return{"CANCELLED"}
+        self.report({'INFO'}, f"Profile written to {self.filepath}")
+        return{"FINISHED"}
+
+class OBJECT_OT_pinguin_lod_by_distance(bpy.types.Operator):
+    """Gives every cutout with LODs the level that matches its distance to the scene camera"""
+    bl_idname = "object.pinguin_lod_by_distance"
+    bl_label = "Update LODs"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        camera = context.scene.camera
+        if camera is None:
+            self.report({'ERROR'}, "The scene has no camera")
+            return{"CANCELLED"}
+        
+        first_distance = context.scene.my_tool.pinguin_lod_distance
+        camera_location = camera.matrix_world.translation
+        swapped_objects = 0
+        for obj in context.scene.objects:
+            if "pinguin_lod_0" not in obj:
+                continue
+            lod_meshes = cutout_lod_meshes(obj)
+            distance = (obj.matrix_world.translation - camera_location).length
+            lod_mesh = lod_meshes[lod_level_for_distance(distance, first_distance, len(lod_meshes))]
+            if obj.data != lod_mesh:
+                obj.data = lod_mesh
+                swapped_objects += 1
+        
+        self.report({'INFO'}, f"{swapped_objects} cutouts changed their LOD")
+        return{"FINISHED"}
+
+class TRANSFORM_OT_face_towards(bpy.types.Operator):
+    """Face cutouts towards an object"""
+    bl_idname = "transform.face_towards"
+    bl_label = "Face Towards"
+    
+    def execute(self, context):
+        
+        # 1 Get target object
+        target_object = context.scene.my_tool.pinguin_face_target_object
+        target_object_location = target_object.location
+        # 2 Get all selected objects
+        selected_objects = bpy.context.selected_objects
+
+        for obj in selected_objects:
+            
+            bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
+            obj_location = obj.location
+            obj_normal_vector = get_first_face_normal(obj)
+            obj_target_vector = target_object_location - obj_location
+            
+            ### Get rotation angles
+            xy_angle_radians, tilt_angle_radians, azimut_angle_radians = get_align_angle(obj_normal_vector, obj_target_vector)
+        # 3 Rotate on xy plane  
+            # set default rotation mode in case Tilt was enabled and then disabled
+            obj.rotation_mode ='XYZ'
+            # Create an Euler rotation object
+            rotation_euler = obj.rotation_euler
+            # Set the rotation in the XY plane
+            rotation_euler.rotate_axis('Z', xy_angle_radians)
+            # Apply the rotation
+            obj.rotation_euler = rotation_euler
+            bpy.ops.object.transform_apply(location=False, rotation=True, scale=False) 
+            
+        return{"FINISHED"}
+
+class TRANSFORM_OT_face_towards_tilt(bpy.types.Operator):
+    """Face cutouts towards an object"""
+    bl_idname = "transform.face_towards_tilt"
+    bl_label = "Tilt"
+        
+    def execute(self, context):
+        
+        tilt_bool = context.scene.my_tool.pinguin_face_target_tilt
+        # 1 Get target object        
+        target_object = context.scene.my_tool.pinguin_face_target_object
+        target_object_location = target_object.location
+        # 2 Get all selected objects
+        selected_objects = bpy.context.selected_objects
+
+        for obj in selected_objects:
+            
+            bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
+        # 3 Get object location
+            obj_location = obj.location
+            obj_normal_vector = get_first_face_normal(obj)
+            obj_target_vector = target_object_location - obj_location
+            ### Formating the object targer vector into a list
+            otv_x, otv_y, otv_z = obj_target_vector
+            obj_target_vector_xyz = [otv_x, otv_y, otv_z]
+            obj_target_vector_xy = [otv_x, otv_y, 0]
+            
+        # 4 Get rotation angles
+            # *the tilt_angle_radians (this is projected in the rotation plane)
+            xy_angle_radians, tilt_angle_radians, azimut_angle_radians = get_align_angle(obj_normal_vector, obj_target_vector)
+            
+            #Cut operation alltogether if the xy_angle is different from 0
+            if abs(xy_angle_radians) > math.radians(1):
+                raise NotFacingTowardsError ("Execute Face Towards operator first")
+            
+            ### Correct Azimut angle if is below object
+            if obj_location[2] < target_object_location [2]:
+                azimut_angle_radians *= -1
+                tilt_angle_radians *= -1
+            
+            
+
+        # 5 Evaluate if it is facing backwards and correct the angle to be only if it is facing towards our object
+            #print(f"Azimut::{math.degrees(azimut_angle_radians)} + Tilt::{math.degrees(tilt_angle_radians)} = {abs(math.degrees(azimut_angle_radians) + math.degrees(tilt_angle_radians))}")
+            
+            if abs(xy_angle_radians) > (math.pi/2):
+                #print("is facing backwards")
+                # print("tar", math.degrees(tilt_angle_radians))
+            ## check rotation direction to tilt angle to calculate the tilt angle in the range [0,360] currently [0,180] because of the dot product/cos_angle
+                #print("obj_target_vector",obj_target_vector_xyz)
+                obj_target_vector_flipped_normalized = normalize_vector(flip_vector(obj_target_vector_xyz))
+            ## Compare z components of the obj_target_vector_flipped_normalized vs the object normal vector projected (this is projected in the rotation plane)
+                
+                projected_obj_normal_vector_onto_target_plane = normalize_vector(project_vector_onto_plane(obj_normal_vector,obj_target_vector_xyz, obj_target_vector_xy))
+                z_tar = projected_obj_normal_vector_onto_target_plane[2]
+                z_otvfn = obj_target_vector_flipped_normalized[2]
+                #print("z_tar", z_tar, "z_otvfn", z_otvfn)
+            
+                if abs(z_otvfn) > abs(z_tar):
+                # Transform axis to a 360 degree rotation format
+                    #print("wheee have to format the angel wheee: ",math.degrees(tilt_angle_radians))
+                    if tilt_angle_radians < 0:
+                        tilt_angle_radians = (-2*math.pi) - tilt_angle_radians
+                    elif tilt_angle_radians > 0:
+                        tilt_angle_radians = (2*math.pi) - tilt_angle_radians
+                    #print("now formated", math.degrees(tilt_angle_radians))
+                
+                # Correct rotation direction (pendin)
+                tilt_angle_radians_after_xy_alignment = ((math.pi) + (2 * abs(azimut_angle_radians)) - abs(tilt_angle_radians))
+                tilt_angle_radians = tilt_angle_radians_after_xy_alignment
+            
+        # 6 Get rotation axis
+            rotation_axis_tilt = normalize_vector(cross_product_3d(obj_target_vector_xyz, obj_target_vector_xy))   
+            # print("6 rotation axis tilt: ",rotation_axis_tilt)
+            
+        # 7 Analize and correct tilt angle direction
+            # Define the rotation angle in radians
+            obj_target_vector_norm = normalize_vector(obj_target_vector_xyz)
+            # pnj_normal_vector is already normalized
+            
+            if obj_target_vector_norm[2] > obj_normal_vector[2]:
+                rotation_angle_radians = tilt_angle_radians
+            elif  obj_target_vector_norm[2] < obj_normal_vector[2]:
+                rotation_angle_radians = tilt_angle_radians * -1
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s tilt: xy %.2f, azimut %.2f, tilt %.2f degrees", obj.name, math.degrees(xy_angle_radians),
+                             math.degrees(azimut_angle_radians), math.degrees(rotation_angle_radians))
+            
+        # 8 Rotate tilt  using quaternions
+            # Create the quaternion rotation
+            quaternion_rotation = Quaternion(rotation_axis_tilt, rotation_angle_radians)
+            # Apply the rotation to the object
+            obj.rotation_mode = 'QUATERNION'
+            obj.rotation_quaternion = quaternion_rotation
+            
+        return{"FINISHED"}
+
+### PANELS ###
+class VIEW_PT_pinguin_create(bpy.types.Panel):
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Pinguin"
+    bl_label = "Cutout to Mesh"
+
+    def draw(self, context):
+        col = self.layout.column()
+        
+        #Shown until Pillow, Open-cv and Numpy are installed
+        if missing_dependencies():
+            col.label(text="Missing dependencies", icon="ERROR")
+            col.operator("preferences.pinguin_install_dependencies", icon="IMPORT")
+
+        #Execute Button
+        col.operator("mesh.png_to_mesh",
+            text="Create",
+            icon="MONKEY")
+        col.scale_y = 2.0 
+    
+        col = self.layout.column(align=True)
+        row = col.row(align=False)
+        col.prop(context.scene.my_tool, "pinguin_folder")
+        row.scale_x = .5
+        
+        col = self.layout.column(align=True)
+        row = col.row(align=True)
+        row.prop(context.scene.my_tool, "pinguin_vertical_orient")
+        row.prop(context.scene.my_tool, "pinguin_holes")
+        col.prop(context.scene.my_tool, "pinguin_mesh_height")
+        row = col.row(align=True)    
+        row.prop(context.scene.my_tool, "pinguin_cv_algorithm")
+        row = col.row(align=True)
+        row.prop(context.scene.my_tool, "pinguin_smooth_window")
+        row.prop(context.scene.my_tool, "pinguin_smooth_kernel", text="")
+        row = col.row(align=True)
+        row.prop(context.scene.my_tool, "pinguin_simplify_error")
+        row.prop(context.scene.my_tool, "pinguin_vertex_budget")
+        row = col.row(align=True)
+        row.prop(context.scene.my_tool, "pinguin_lod_levels")
+        row.prop(context.scene.my_tool, "pinguin_lod_error")
+        row = col.row(align=True)
+        row.prop(context.scene.my_tool, "pinguin_lod_distance")
+        row.operator("object.pinguin_lod_by_distance", icon="CAMERA_DATA")
+        row = col.row(align=True)
+        row.prop(context.scene.my_tool, "pinguin_workers")
+        row.prop(context.scene.my_tool, "pinguin_worker_pool", text="")
+        row = col.row(align=True)
+        row.prop(context.scene.my_tool, "pinguin_sync")
+        row.prop(context.scene.my_tool, "pinguin_cache")
+        row = col.row(align=True)
+        row.prop(context.scene.my_tool, "pinguin_crop")
+        row.prop(context.scene.my_tool, "pinguin_atlas")
+        row.prop(context.scene.my_tool, "pinguin_atlas_size", text="")
+        row = col.row(align=True)
+        row.prop(context.scene.my_tool, "pinguin_proxy_sizes")
+        col.operator_menu_enum("material.pinguin_swap_textures", "resolution", icon="TEXTURE")
+        col.prop(context.scene.my_tool, "pinguin_alpha_masks")
+        col.prop(context.scene.my_tool, "pinguin_profile")
+
+class VIEW_PT_pinguin_profile(bpy.types.Panel):
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Pinguin"
+    bl_label = "Profile"
+    bl_parent_id = "VIEW_PT_pinguin_create"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        col = self.layout.column()
+        profiler = last_profile["profiler"]
+        if profiler is None:
+            col.label(text="Enable Profile and convert a folder", icon="INFO")
+            return
+
+        #Totals of the last run (made once when it finished), the stages of the workers overlap so they can add up to more than the wall time
+        summary = profiler.summary()
+        col.label(text=f"Wall {summary['wall_ms'] / 1000:.2f} s   CPU {summary['cpu_ms'] / 1000:.2f} s")
+        grid = col.grid_flow(row_major=True, columns=3, align=True)
+        for label in ("Stage", "Wall ms", "CPU ms"):
+            grid.label(text=label)
+        for stage, stage_total in summary["stages"].items():
+            grid.label(text=stage)
+            grid.label(text=f"{stage_total['wall_ms']:.0f}")
+            grid.label(text=f"{stage_total['cpu_ms']:.0f}")
+
+        col = self.layout.column(align=True)
+        for counter, amount in summary["counters"].items():
+            col.label(text=f"{counter}: {amount}")
+
+        col = self.layout.column(align=True)
+        col.label(text="Slowest images")
+        for image, wall_ms in profiler.slowest_images(summary=summary):
+            col.label(text=f"{image}  {wall_ms:.0f} ms")
+        self.layout.operator("wm.pinguin_export_profile", icon="EXPORT")
+
+class VIEW_PT_facetowards(bpy.types.Panel):
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Pinguin"
+    bl_label = "Face Towards"
+    
+    def draw(self, context):
+        col = self.layout.column(align=True)
+        col.scale_y = 1.5
+        #Execute Button
+        col.operator("transform.face_towards",
+            text="Face Towards",
+            icon="LIGHT_AREA")
+        col.operator("transform.face_towards_tilt",
+            text="Tilt",
+            icon="DRIVER_ROTATIONAL_DIFFERENCE")
+        
+        
+        col = self.layout.column(align=True)
+        row = col.row(align=False)
+        row.prop(context.scene.my_tool, "pinguin_face_target_object",   text="")
+        
+        """
+        row.scale_x = .4
+        row.prop(context.scene.my_tool, "pinguin_face_target_tilt",   text="Tilt")
+        """
+### FUNCTIONS ### 
+
+### Here all the custom functions for the main program
+### def_creates the mesh of a cutout from its triangulated contours, holes included when they were requested
+def mesh_from_cutout(cutout, directory, collection=None, material_registry=None, atlas=None, profiler=null_profiler):
+    
+    ### THATS WHAT I AM TAKING ABOUT, THATS WHY HE IS THE MVP, THATS WHY HE IS THE GOAT!
+    ### Not only returns a beautiful mesh but also unwrapps it Lets gooo!
+
+    #create meshes from the triangulated contours
+    with profiler.stage("mesh", cutout["name"]):
+        obj = mesh_from_contours_info(cutout["mesh_verts"], cutout["extents"], cutout["name"], cutout["triangles"], collection)
+    with profiler.stage("lod meshes", cutout["name"]):
+        attach_cutout_lods(obj, cutout)
+    with profiler.stage("material", cutout["name"]):
+        assign_cutout_material(obj, cutout, directory, material_registry, atlas)
+    return obj
+
+### def_normalized path of a png, it is the key that links a cutout object with its source file
+def cutout_source_key(png_path):
+    return os.path.normpath(bpy.path.abspath(png_path))
+
+### def_stores in the object where it comes from, sync mode compares these with the png files to find what changed
+def tag_cutout_object(obj, cutout, settings_hash):
+    obj["pinguin_source"] = cutout_source_key(cutout["path"])
+    obj["pinguin_mtime"] = cutout["mtime"]
+    obj["pinguin_hash"] = cutout["hash"]
+    obj["pinguin_settings"] = settings_hash
+
+### def_cutout objects of a collection by source png, objects without source (made by hand or before sync existed) are left out
+def cutout_objects_by_source(collection):
+    if collection is None:
+        return {}
+    return {obj["pinguin_source"]: obj for obj in collection.objects if "pinguin_source" in obj}
+
+### def_swaps the mesh of an existing cutout object, location, rotation, modifiers and materials stay as they are
+def rebuild_cutout_mesh(obj, cutout):
+    old_meshes = cutout_lod_meshes(obj)
+    mesh_data = mesh_data_from_contours(cutout["mesh_verts"], cutout["extents"], cutout["name"], cutout["triangles"])
+    for material in obj.data.materials:
+        mesh_data.materials.append(material)
+    obj.data = mesh_data
+    clear_cutout_lods(obj)
+    for old_mesh in old_meshes:
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+    attach_cutout_lods(obj, cutout)
+
+    # The png changed, so do the pixels of its texture
+    for material in mesh_data.materials:
+        if material is None or not material.use_nodes:
+            continue
+        for node in material.node_tree.nodes:
+            if node.type == "TEX_IMAGE" and node.image is not None:
+                node.image.reload()
+    item_log(logging.INFO, "updated", "%s updated", cutout["name"])
+
+### def_deletes a cutout object whose png is gone, its mesh too when nothing else uses it
+def remove_cutout_object(obj):
+    item_log(logging.INFO, "removed", "%s removed, its png no longer exists", obj.name)
+    discard_cutout_object(obj)
+
+### def_deletes a cutout object and the meshes (every LOD) only it was using
+def discard_cutout_object(obj):
+    old_meshes = cutout_lod_meshes(obj)
+    bpy.data.objects.remove(obj)
+    for old_mesh in old_meshes:
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+
+### def_keeps the LOD meshes of a cutout in the object itself, as "pinguin_lod_<level>" custom properties pointing
+### to the mesh datablocks (level 0 is the full mesh), so they are saved with it whichever one is in use
+def attach_cutout_lods(obj, cutout):
+    if not cutout.get("lods"):
+        return
+    obj["pinguin_lod_0"] = obj.data
+    for lod_level, (lod_verts, lod_triangles) in enumerate(cutout["lods"], 1):
+        lod_mesh = mesh_data_from_contours(lod_verts, cutout["extents"], f"{cutout['name']}_LOD{lod_level}", lod_triangles)
+        for material in obj.data.materials:
+            lod_mesh.materials.append(material)
+        obj[f"pinguin_lod_{lod_level}"] = lod_mesh
+
+### def_meshes of every LOD level of a cutout object, just its mesh when it has no LODs
+def cutout_lod_meshes(obj):
+    lod_meshes = []
+    while f"pinguin_lod_{len(lod_meshes)}" in obj:
+        lod_meshes.append(obj[f"pinguin_lod_{len(lod_meshes)}"])
+    return lod_meshes or [obj.data]
+
+### def_forgets the LOD meshes of a cutout object, removing them is left to the caller
+def clear_cutout_lods(obj):
+    lod_level = 0
+    while f"pinguin_lod_{lod_level}" in obj:
+        del obj[f"pinguin_lod_{lod_level}"]
+        lod_level += 1
+
+### def_toma la informacion de vertices y caras y produce el objeto con su malla, see mesh_data_from_contours
+def mesh_from_contours_info(verts_set, 
+                            extent_set,
+                            mesh_name,
+                            triangles,
+                            collection = None):
+
+    mesh_data = mesh_data_from_contours(verts_set, extent_set, mesh_name, triangles)
+    obj = bpy.data.objects.new(mesh_name, mesh_data)
+    if collection is None:
+        collection = bpy.context.scene.collection
+    collection.objects.link(obj)
+    
+    ### Succesfull Finished this shite - Letsss goooo 
+    item_log(logging.INFO, "converted", "%s converted", mesh_name)
+    return obj
+
+### def_produce la malla escribiendo directamente los arrays (foreach_set)
+### no operators, no edit mode and no joins: the 4 image extents are kept as loose vertices so the object keeps
+### the image bounds, then the (T,3) triangles over the contour vertices (see triangulate_contours, counterclockwise, normals +z)
+def mesh_data_from_contours(verts_set, extent_set, mesh_name, triangles):
+
+    extent_set = np.asarray(extent_set, dtype=np.float32)
+    face_verts_set = [np.asarray(each_vert, dtype=np.float32) for each_vert in verts_set]
+    loop_totals = np.full(len(triangles), 3, dtype=np.int32)
+    loop_vertex_indices = (np.asarray(triangles, dtype=np.int32) + len(extent_set)).ravel()
+
+    ### Vertices: extents first and then every contour one after the other
+    coordinates = np.concatenate([extent_set] + face_verts_set).reshape(-1, 3)
+    loop_starts = np.zeros(len(loop_totals), dtype=np.int32)
+    if len(loop_totals):
+        loop_starts[1:] = np.cumsum(loop_totals)[:-1]
+
+    mesh_data = bpy.data.meshes.new(mesh_name)
+    mesh_data.vertices.add(len(coordinates))
+    mesh_data.vertices.foreach_set("co", coordinates.ravel())
+    mesh_data.loops.add(len(loop_vertex_indices))
+    mesh_data.loops.foreach_set("vertex_index", loop_vertex_indices)
+    mesh_data.polygons.add(len(loop_starts))
+    mesh_data.polygons.foreach_set("loop_start", loop_starts)
+    # Blender 4.0 derives the polygon sizes from loop_start
+    if bpy.app.version < (4, 0, 0):
+        mesh_data.polygons.foreach_set("loop_total", loop_totals)
+    mesh_data.update(calc_edges=True)
+
+    ### WHAAAT OMG! - Creates Uvs from extents, the xy position of each loop vertex over the image size
+    ext_min = extent_set.min(axis=0)
+    ext_size = extent_set.max(axis=0) - ext_min
+    loop_uvs = (coordinates[loop_vertex_indices, :2] - ext_min[:2]) / ext_size[:2]
+    uv_layer = mesh_data.uv_layers.new(name="UVMap")
+    uv_layer.data.foreach_set("uv", loop_uvs.astype(np.float32).ravel())
+    return mesh_data
+
+### def_materials already made from each png (by source path), every object converted from the same png shares it
+def cutout_material_registry():
+    return {mat["pinguin_source"]: mat for mat in bpy.data.materials if "pinguin_source" in mat}
+
+### def_creates a material for each png, or reuses the one already made from it
+def material_to_mesh(mesh_name, directory, ob=None, material_registry=None): 
+    
+    if ob is None:
+        ob = bpy.context.active_object
+    if material_registry is None:
+        material_registry = cutout_material_registry()
+    
+    original_image_filepath = (directory+"/"+mesh_name+".png") 
+    source = cutout_source_key(original_image_filepath)
+    
+    # Get material
+    mat = material_registry.get(source)
+    if mat is None:
+        # create material
+        mat = bpy.data.materials.new(name=mesh_name)
+        mat["pinguin_source"] = source
+        cutout_material_nodes(mat, original_image_filepath)
+        material_registry[source] = mat
+    else:
+        # Made by an earlier run, the png (or its crop) may have been edited since
+        for node in mat.node_tree.nodes:
+            if node.type == "TEX_IMAGE" and node.image is not None:
+                refresh_cutout_image(node.image)
+    
+    # Assign it to object    
+    set_cutout_material(ob, mat)
+    return mat
+
+### def_puts the material in the first slot of the object mesh, or of every one of its LOD meshes
+def set_cutout_material(ob, mat):
+    for mesh_data in cutout_lod_meshes(ob):
+        if mesh_data.materials:
+            # assign to 1st material slot
+            mesh_data.materials[0] = mat
+        else:
+            # no slots
+            mesh_data.materials.append(mat)
+
+### def_builds the node tree of a cutout material: its own image into the shared "Pinguin Cutout" group
+### the image is loaded only if no datablock uses that file yet
+def cutout_material_nodes(mat, image_filepath):
+    
+    # Toogle use Nodes
+    mat.use_nodes = True
+    
+    # Get the material node tree and # Clear all nodes
+    tree = mat.node_tree    
+    for node in tree.nodes:
+        tree.nodes.remove(node)
+    
+    # Instance of the shared shader, see cutout_node_group
+    group_node = tree.nodes.new("ShaderNodeGroup")
+    group_node.node_tree = cutout_node_group()
+
+    # Create an Material Output node    
+    output_node = tree.nodes.new('ShaderNodeOutputMaterial')
+    output_node.location = (300,0)
+    
+    # Create an Image node
+    image_node = tree.nodes.new("ShaderNodeTexImage")
+    image_node.location = (-300,0)
+    
+    # Load the image and # Set the image property of the Image node to the loaded image
+    # check_existing returns the datablock already made from this file instead of loading a duplicate
+    original_image = bpy.data.images.load(image_filepath, check_existing=True)    
+    refresh_cutout_image(original_image)
+    image_node.image = original_image
+    # Full resolution texture, its proxies are found from it (see MATERIAL_OT_pinguin_swap_textures)
+    mat["pinguin_texture"] = image_filepath
+    
+    tree.links.new(group_node.outputs["BSDF"], output_node.inputs["Surface"])
+    tree.links.new(image_node.outputs["Color"], group_node.inputs["Color"])
+    tree.links.new(image_node.outputs["Alpha"], group_node.inputs["Alpha"])
+
+### def_reloads an image whose file changed after it was loaded, images stay in the blend file between runs
+### the modification time of the file is kept on the image to compare it with on the next run
+def refresh_cutout_image(image):
+    image_filepath = bpy.path.abspath(image.filepath)
+    if not os.path.exists(image_filepath):
+        return
+    texture_mtime = os.path.getmtime(image_filepath)
+    if image.get("pinguin_mtime", texture_mtime) != texture_mtime:
+        image.reload()
+    image["pinguin_mtime"] = texture_mtime
+
+cutout_node_group_name = "Pinguin Cutout"
+
+### def_shader shared by every cutout material, a Principled BSDF fed with the image color and alpha
+### built once per blend file, editing it changes the look of every cutout at once
+def cutout_node_group():
+    group = bpy.data.node_groups.get(cutout_node_group_name)
+    if group is not None:
+        return group
+
+    group = bpy.data.node_groups.new(cutout_node_group_name, "ShaderNodeTree")
+    # Blender 4.0 moved the group sockets into the interface and renamed Specular
+    if bpy.app.version < (4, 0, 0):
+        group.inputs.new("NodeSocketColor", "Color")
+        alpha_socket = group.inputs.new("NodeSocketFloatFactor", "Alpha")
+        group.outputs.new("NodeSocketShader", "BSDF")
+        specular_input = "Specular"
+    else:
+        group.interface.new_socket("Color", in_out="INPUT", socket_type="NodeSocketColor")
+        alpha_socket = group.interface.new_socket("Alpha", in_out="INPUT", socket_type="NodeSocketFloat")
+        group.interface.new_socket("BSDF", in_out="OUTPUT", socket_type="NodeSocketShader")
+        specular_input = "Specular IOR Level"
+    alpha_socket.default_value = 1.0
+    alpha_socket.min_value = 0.0
+    alpha_socket.max_value = 1.0
+
+    input_node = group.nodes.new("NodeGroupInput")
+    input_node.location = (-300,0)
+    output_node = group.nodes.new("NodeGroupOutput")
+    output_node.location = (300,0)
+
+    principled_bsdf_node = group.nodes.new("ShaderNodeBsdfPrincipled")
+    principled_bsdf_node.inputs[specular_input].default_value = 0.0
+    principled_bsdf_node.inputs["Roughness"].default_value = 0.2
+
+    # Sockets by name, the position of Alpha in the Principled BSDF changes between versions
+    group.links.new(input_node.outputs["Color"], principled_bsdf_node.inputs["Base Color"])
+    group.links.new(input_node.outputs["Alpha"], principled_bsdf_node.inputs["Alpha"])
+    group.links.new(principled_bsdf_node.outputs["BSDF"], output_node.inputs["BSDF"])
+    return group
+
+### def_moves the UVs of a mesh to uv * scale + offset, to point them at a region of another texture
+def remap_mesh_uvs(mesh_data, scale, offset):
+    uv_layer = mesh_data.uv_layers[0]
+    loop_uvs = np.empty(len(uv_layer.data) * 2, dtype=np.float32)
+    uv_layer.data.foreach_get("uv", loop_uvs)
+    loop_uvs = loop_uvs.reshape(-1, 2) * np.array(scale, dtype=np.float32) + np.array(offset, dtype=np.float32)
+    uv_layer.data.foreach_set("uv", loop_uvs.ravel())
+
+### def_gives a new or rebuilt cutout object its atlas region, or its own material when there is no atlas or it does not fit
+def assign_cutout_material(obj, cutout, directory, material_registry=None, atlas=None):
+    if atlas is None or not atlas.add(obj, cutout):
+        material_to_mesh(cutout["name"], directory, obj, material_registry)
+
+### def_True when the first slot of a cutout object is empty or still holds a material made by Pinguin (own or atlas page)
+### a material the user put there instead is kept on sync rebuilds, together with the UVs that go with it
+def has_pinguin_material(obj):
+    mat = obj.data.materials[0] if obj.data.materials else None
+    return mat is None or "pinguin_texture" in mat
+
+### def_packs the alpha bounded part of many cutouts into a few shared atlas textures, one material per page
+### pages are filled one after the other, a full page is written as a png and then given to all its objects
+class CutoutAtlas:
+    def __init__(self, atlas_path, page_size=4096, padding=atlas_padding, proxy_sizes=()):
+        self.atlas_path = atlas_path
+        self.page_size = page_size
+        self.padding = padding
+        self.proxy_sizes = proxy_sizes
+        self.page_paths = []
+        # Pages of previous runs stay untouched, synced objects may still use them
+        self.page_number = 0
+        while os.path.exists(self.page_path()):
+            self.page_number += 1
+        self.start_page()
+
+    def page_path(self):
+        return os.path.join(self.atlas_path, f"atlas_{self.page_number:03d}.png")
+
+    def start_page(self):
+        self.packer = ShelfPacker(self.page_size, self.page_size, self.padding)
+        self.pixels = None
+        self.page_objects = []
+
+    ### copies the cutout pixels into the page and points its UVs there, False when it is larger than a page
+    ### the pixels come already cropped from the workers (see write_cutout_textures), the png is not decoded again here
+    def add(self, obj, cutout):
+        x0, y0, x1, y1 = cutout["bbox"]
+        position = self.packer.insert(x1 - x0, y1 - y0)
+        if position is None and self.page_objects:
+            self.finish_page()
+            position = self.packer.insert(x1 - x0, y1 - y0)
+        if position is None:
+            return False
+
+        if self.pixels is None:
+            self.pixels = np.zeros((self.page_size, self.page_size, 4), dtype=np.uint8)
+        page_x, page_y = position
+        self.pixels[page_y:page_y + y1 - y0, page_x:page_x + x1 - x0] = cutout.pop("atlas_pixels")
+
+        uv_transform = atlas_uv_transform(cutout["dimensions"], cutout["bbox"], position, self.page_size)
+        for mesh_data in cutout_lod_meshes(obj):
+            remap_mesh_uvs(mesh_data, *uv_transform)
+        self.page_objects.append(obj)
+        return True
+
+    ### writes the current page and gives its material to the objects packed in it
+    def finish_page(self):
+        if not self.page_objects:
+            return
+        page_path = self.page_path()
+        page_image = Image.fromarray(self.pixels)
+        page_image.save(page_path)
+        save_proxy_textures(page_image, page_path, self.proxy_sizes)
+
+        mat = bpy.data.materials.new(name=os.path.basename(page_path)[:-4])
+        cutout_material_nodes(mat, page_path)
+        for obj in self.page_objects:
+            set_cutout_material(obj, mat)
+
+        self.page_paths.append(page_path)
+        self.page_number += 1
+        self.start_page()
+
+### def_talkes all objects and arrays them in a grid based in the widest obj    
+def organize_objects(collection_objs):
+    
+    x_location,y_location,z_location = bpy.context.scene.cursor.location
+    ox_location = x_location
+
+    number_in_row = 0
+    collection_len = len(collection_objs.objects)
+    collection_row_len = round(math.sqrt(collection_len))
+    
+    x_dim_list_width = []
+    y_dim_list_height = []
+    
+    # Loop through all objects in the collection and picks the largest dimensions to create an non-overlaping array
+    for obj in collection_objs.objects:
+                
+        obj.select_set(True)
+        obj_dim = obj.dimensions
+        x_len, y_len, z_len = obj_dim
+        
+        x_dim_list_width.append(x_len)
+        y_dim_list_height.append(y_len)
+        
+    x_len = max(x_dim_list_width)
+    y_len = max(y_dim_list_height)
+    
+    #Moves each object to a position in the array  
+    for obj in collection_objs.objects:
+        
+        obj.location = (x_location, y_location, z_location)        
+        x_location = x_location + (x_len*1.1)
+        
+        number_in_row +=  1
+        
+        if number_in_row > collection_row_len:
+            y_location = y_location + (y_len*1.1)
+            x_location = ox_location  
+            number_in_row = 0
+
+### def_ gets the firs indexd normal of any given mesh
+def get_first_face_normal(obj):
+    if obj.type == 'MESH':
+        mesh = obj.data
+    # Ensure the mesh has polygons
+    if mesh.polygons:
+        # Get the first face (polygon)
+        face = mesh.polygons[0]
+        # Get the normal vector of the face
+        normal = face.normal
+        # Print the normal vector
+        return normal
+    
+    # Implement
+    if obj.type == "CAMERA":
+        logger.warning("camera facing not yet implemented, coming soon!")
+    
+### def 
+def get_align_angle(normal_vector, target_vector):
+    
+    x_normal, y_normal, z_normal = normal_vector
+    x_target, y_target, z_target = target_vector
+
+### 1.1 Calculate the rotation angle using the dot product
+    # Calculate the dot product of the vectors in the XY plane
+    dot_product = x_normal * x_target + y_normal * y_target
+    # Calculate the magnitudes of the projected vectors 
+    magnitude1 = math.sqrt(x_normal ** 2 + y_normal ** 2)
+    magnitude2 = math.sqrt(x_target** 2 + y_target ** 2)
+    # Calculate the cosine of the angle using the dot product and magnitudes
+    try:
+        cos_angle = dot_product / (magnitude1 * magnitude2)
+    #This handles the perpendicular orientation error
+    except ZeroDivisionError:
+        raise PerpendicularOrientError("cannot orient, face normal is directly perpendicular to object-target_vector")
+    # 3 Rotate on xy plane  
+    # Catch oput of range error
+    if cos_angle < -1:
+        cos_angle = -1
+    elif cos_angle > 1:
+        cos_angle = 1
+    # Calculate the angle using the arccosine function
+    xy_angle_radians = math.acos(cos_angle)    
+    
+### 1.2 Calculate the direction of rotation using the cross product sign
+    cross_product = x_normal * y_target - y_normal * x_target
+    if cross_product < 0:
+        xy_angle_radians *= -1   
+    
+### 2.1Calculate Azimut (angle)
+    # Calculate the dot product of the vectors in the XY plane
+    dot_product_azimut = x_target * x_target + y_target * y_target + z_target * 0
+    # Calculate the magnitudes of the projected vectors 
+    magnitude1_azimut = math.sqrt(x_target ** 2 + y_target ** 2 + z_target **2)
+    magnitude2_azimut = math.sqrt(x_target ** 2 + y_target ** 2)
+    # Calculate the cosine of the angle using the dot product and magnitudes
+    cos_angle_azimut = dot_product_azimut / (magnitude1_azimut * magnitude2_azimut)
+    # Catch oput of range error
+    if cos_angle_azimut < -1:
+        cos_angle_azimut = -1
+    elif cos_angle_azimut > 1:
+        cos_angle_azimut = 1
+    azimut_angle_radians = math.acos(cos_angle_azimut)
+
+### 3.1 Project normal vector into target vector plane
+    # Construct vectors
+    target_vector__xy = [target_vector[0], target_vector[1], 0]
+    #reformat vectors
+    normal_vector = [x_normal, y_normal, z_normal] 
+    target_vector = [x_target, y_target, z_target]
+    ### project
+    normal_vector_onto_target_plane = project_vector_onto_plane(normal_vector, target_vector, target_vector__xy)
+### Calculate tilt angle
+# Solve this shite, learn bout quaternions
+# 3Blue1Brown on quaternions: https://www.youtube.com/watch?v=zjMuIxRvygQ&t=353s
+    
+    x_nvotp, y_nvotp, z_nvotp = normal_vector_onto_target_plane
+    # Calculate the dot product of the vectors
+    dot_product_tilt = x_nvotp * x_target + y_nvotp * y_target + z_nvotp * z_target
+    # Calculate the magnitudes of the projected vectors 
+    magnitude1_tilt = math.sqrt(x_nvotp ** 2 + y_nvotp ** 2 + z_nvotp ** 2)
+    magnitude2_tilt = math.sqrt(x_target** 2 + y_target ** 2 + z_target ** 2)
+    # Calculate the cosine of the angle using the dot product and magnitudes
+    cos_angle_tilt = dot_product_tilt / (magnitude1_tilt * magnitude2_tilt)
+        # Catch oput of range error
+    if cos_angle_tilt < -1:
+        cos_angle_tilt = -1
+    elif cos_angle_tilt > 1:
+        cos_angle_tilt = 1
+    # Calculate the angle using the arccosine function
+    tilt_angle_radians = math.acos(cos_angle_tilt)
+    
+    return xy_angle_radians, tilt_angle_radians, azimut_angle_radians
+    
+
+def reset_world_matrix(obj):
+    
+    logger.debug("Resetting the world matrix of %s", obj.name)
+    ### Store object_location
+    obj_location = obj.location
+    obj_x, obj_y, obj_z = obj_location
+    
+    ### Move object to world origin
+    obj.location = (0,0,0)
+    
+    ### Ctrl A  --- Apply transforms
+    bpy.ops.object.transform_apply(location=True, rotation=True, scale=False)
+    
+    ### Return object to original location
+    obj.location = (obj_x, obj_y, obj_z)
+
+
+### HEADLESS ###
+### def_runs the whole conversion of a folder with no UI context (the Create operator and the CLI below call it)
+### the arguments mirror the Cutout to Mesh panel, returns a summary of what was done
+def convert_directory(directory,
+                      mesh_height=1.7,
+                      orient_vertical=True,
+                      holes=False,
+                      algorithm=("SIMPLE",),
+                      workers=0,
+                      pool="thread",
+                      smooth_window=3,
+                      smooth_kernel="BOX",
+                      simplify_error=0.0,
+                      vertex_budget=0,
+                      lod_levels=0,
+                      lod_error=0.005,
+                      sync=False,
+                      cache=True,
+                      crop=False,
+                      atlas=False,
+                      atlas_size=4096,
+                      proxy_sizes=(),
+                      save_alpha_masks=False,
+                      profiler=None):
+    
+    ### -1.Variable Assignment
+    create_holes = holes
+    chain_aproximation_method = set(algorithm)
+    use_cache = cache
+    use_atlas = atlas
+    use_crop = crop
+    proxy_sizes = sorted(proxy_sizes)
+    if profiler is None:
+        profiler = null_profiler
+    
+    missing = missing_dependencies()
+    if missing:
+        raise ImportError(f"Missing {', '.join(missing)}, use Install dependencies first")
+    # First conversion of the session pays the Pillow/Open-cv/Numpy import here, never at startup
+    try:
+        load_dependencies()
+    except ImportError as error:
+        missing_dependencies(refresh=True)
+        raise ImportError(f"Could not import dependencies: {error}") from error
+
+    # "CHAIN_APPROX_SIMPLE" or "CHAIN_APROX_NONE"   
+
+    proxie_collection = "proxie_collection_pinguin"
+    final_collection = "Pinguin-Cutout to Mesh"   
+
+    x_cursor,y_cursor,z_cursor = bpy.context.scene.cursor.location   
+    
+    ### 0. Program Start - Main()
+    start_time = time.time()
+    item_log.reset()
+    logger.debug("Checking directory %s", directory)
+    
+    ### Checks Directory Existance
+    if directory == "":
+        raise TypeError("Empty directory")
+    elif not os.path.exists(directory):
+        raise FileNotFoundError(f"The directory '{directory}' does not exist.")
+
+    ### 1. Finds all new pngs, each one is then carried alone from decode to finished object (see iter_cutouts)
+    png_paths = image_png_paths(directory)
+    found_pngs = len(png_paths)
+    
+    ### 2. Saves alpha channel maps, only as debug masks
+    alpha_channels_path = None
+    if save_alpha_masks:
+        alpha_channels_directory = "Alpha Channel"
+        alpha_channels_path = directory + "/" + alpha_channels_directory
+        
+        if not os.path.exists(alpha_channels_path):
+            os.mkdir(alpha_channels_path)
+
+    ### 2.5 Contour cache, processed cutouts are stored per image and reused while the png and settings do not change
+    cache_path = None
+    if use_cache:
+        cache_path = directory + "/" + "Contour Cache"
+        
+        if not os.path.exists(cache_path):
+            os.mkdir(cache_path)
+        # Entries of deleted or renamed pngs would otherwise stay there forever
+        pruned_files = prune_cutout_cache(cache_path, png_paths)
+        if pruned_files:
+            logger.debug("%d contour cache files of missing pngs removed", pruned_files)
+
+    ### 2.6 Atlas, cutouts share a few big textures instead of one image and material each
+    atlas = None
+    if use_atlas:
+        atlas_path = directory + "/" + "Atlas"
+        
+        if not os.path.exists(atlas_path):
+            os.mkdir(atlas_path)
+        atlas = CutoutAtlas(atlas_path, atlas_size, proxy_sizes=proxy_sizes)
+
+    ### 2.7 Cropped textures, only the part of each png inside its contours is loaded (the atlas already crops)
+    crop_path = None
+    texture_directory = directory
+    if use_crop and atlas is None:
+        crop_path = directory + "/" + "Cropped"
+        texture_directory = crop_path
+        
+        if not os.path.exists(crop_path):
+            os.mkdir(crop_path)
+
+    ### Settings sent to the workers, plain values only so they can be handed to other processes
+    cutout_settings = {"mesh_height": mesh_height,
+                           "algorithm": chain_aproximation_method,
+                           "smooth_window": smooth_window,
+                           "smooth_kernel": smooth_kernel,
+                           "holes": create_holes,
+                           "simplify_error": simplify_error,
+                           "vertex_budget": vertex_budget,
+                           "lod_errors": [lod_error * 4**lod_level for lod_level in range(lod_levels)],
+                           "alpha_channels_path": alpha_channels_path,
+                           "cache_path": cache_path,
+                           "crop_path": crop_path,
+                           "proxy_sizes": proxy_sizes,
+                           "atlas_size": atlas_size if use_atlas else 0}
+    settings_hash = cutout_settings_hash(cutout_settings)
+
+    ### 2.8 Sync, diffs the pngs against the objects already converted, unchanged ones are left alone and never read
+    synced_objects = {}
+    removed_cutouts = 0
+    if sync:
+        synced_objects = cutout_objects_by_source(bpy.data.collections.get(final_collection))
+        png_sources = {cutout_source_key(png_path) for png_path in png_paths}
+        directory_source = cutout_source_key(directory)
+        
+        # Objects whose png was deleted or renamed
+        for source, obj in list(synced_objects.items()):
+            if os.path.dirname(source) == directory_source and source not in png_sources:
+                remove_cutout_object(obj)
+                del synced_objects[source]
+                removed_cutouts += 1
+        
+        png_paths = [png_path for png_path in png_paths
+                         if not cutout_object_is_current(synced_objects.get(cutout_source_key(png_path)),
+                                                         os.path.getmtime(png_path), settings_hash)]
+
+    ### 3.Bl Creates a new proxie_collection to store_ resultant meshes temporarly 
+    collections = bpy.data.collections
+    pinguin_collection_name = proxie_collection
+
+    if pinguin_collection_name in collections:
+        pinguin_collection = bpy.data.collections.get(pinguin_collection_name)
+    else:       
+        pinguin_collection = bpy.data.collections.new(pinguin_collection_name)
+        bpy.context.scene.collection.children.link(pinguin_collection)       
+    
+    try:
+        ### 4.Bl Meshes from contour sets, the previous cutout (alpha plane, contours) is released before the next one is decoded
+        ### New cutouts go through the proxie collection, synced ones get their mesh swapped where they are
+        logger.debug("Creating meshes from %d of %d pngs", len(png_paths), found_pngs)
+
+        cached_cutouts = 0
+        updated_cutouts = 0
+        contour_vertices = 0
+        mesh_vertices = 0
+        ### Images and materials are shared by every object made from the same png, the ones not loaded again are counted
+        material_registry = cutout_material_registry()
+        reused_images = 0
+        saved_bytes = 0
+        for cutout in iter_cutouts(png_paths, cutout_settings, workers, profiler, pool):
+            obj = synced_objects.get(cutout_source_key(cutout["path"]))
+            if obj is None:
+                images_before = len(bpy.data.images)
+                obj = mesh_from_cutout(cutout, texture_directory, pinguin_collection, material_registry, atlas, profiler)
+                if atlas is None and len(bpy.data.images) == images_before:
+                    reused_images += 1
+                    # 8 bit RGBA pixels of the duplicate that was not loaded
+                    x0, y0, x1, y1 = cutout["bbox"] if crop_path is not None else (0, 0, cutout["dimensions"][1], cutout["dimensions"][0])
+                    saved_bytes += (x1 - x0) * (y1 - y0) * 4
+            elif obj.get("pinguin_hash") != cutout["hash"] or obj.get("pinguin_settings") != settings_hash:
+                with profiler.stage("mesh", cutout["name"]):
+                    rebuild_cutout_mesh(obj, cutout)
+                # New UVs, so a new atlas region (or back to its own material when the atlas is off)
+                if has_pinguin_material(obj):
+                    with profiler.stage("material", cutout["name"]):
+                        assign_cutout_material(obj, cutout, texture_directory, material_registry, atlas)
+                updated_cutouts += 1
+            # Same content with a new modification time only needs the new tags
+            tag_cutout_object(obj, cutout, settings_hash)
+            cached_cutouts += cutout["cached"]
+            contour_vertices += cutout["vertex_counts"][0]
+            mesh_vertices += cutout["vertex_counts"][1]
+            profiler.count("images")
+            profiler.count("vertices", len(obj.data.vertices))
+            profiler.count("faces", len(obj.data.polygons))
+        profiler.count("cached", cached_cutouts)
+        if atlas is not None:
+            with profiler.stage("atlas"):
+                atlas.finish_page()
+                
+        ### 5. Array Meshes in collection in a matrix
+        bpy.context.scene.cursor.location = Vector((x_cursor,y_cursor,z_cursor))
+        if pinguin_collection.objects:
+            with profiler.stage("organize"):
+                organize_objects(pinguin_collection)
+        for obj in bpy.context.view_layer.objects:
+            obj.select_set(False)
+
+        ### 5.5 Orient Meshes Vertical if True, stands them up (+90 degrees in X) without operators so it also runs headless
+        if orient_vertical:
+            for obj in pinguin_collection.objects:
+                obj.rotation_euler.x += math.pi/2
+    
+        ### 6.Bl Creates a new final_collection to store_meshes
+        collections = bpy.data.collections
+        final_collection_name = final_collection
+    
+        if final_collection_name in collections:
+            final_pinguin_collection = bpy.data.collections.get(final_collection_name)
+        else:       
+            final_pinguin_collection = bpy.data.collections.new(final_collection_name)
+            bpy.context.scene.collection.children.link(final_pinguin_collection) 
+    
+        ### 7. Move all Objects to final collection and removes/hides the proxie collection         
+        new_objects = [obj.name for obj in pinguin_collection.objects]
+        for obj in list(pinguin_collection.objects):
+            for other_col in obj.users_collection:
+                other_col.objects.unlink(obj)
+            if obj.name not in final_pinguin_collection:
+                final_pinguin_collection.objects.link(obj)
+                obj.select_set(True)
+    finally:
+        ### A folder that fails part way leaves none of its half built objects behind for the next one
+        for obj in list(pinguin_collection.objects):
+            discard_cutout_object(obj)
+        bpy.data.collections.remove(pinguin_collection)
+    
+    ### 8. Returns statistics on how the program performed
+    end_time = time.time()
+    elapsed_time = end_time - start_time
+    # One line per folder whatever its size, the per cutout messages above are rate limited and the ones left out are counted here
+    skipped_messages = item_log.skipped_summary()
+    logger.info("%s: %d pngs, %d converted, %d updated, %d removed, %d unchanged, %d from the contour cache, "
+                "%d atlas pages, %d contour vertices, %.2f seconds%s",
+                directory, found_pngs, len(new_objects), updated_cutouts, removed_cutouts, found_pngs - len(png_paths),
+                cached_cutouts, len(atlas.page_paths) if atlas is not None else 0, mesh_vertices, elapsed_time,
+                f" ({skipped_messages} messages not shown)" if skipped_messages else "")
+    profiler.finish()
+    return {"directory": directory,
+            "pngs": found_pngs,
+            "converted": len(new_objects),
+            "updated": updated_cutouts,
+            "removed": removed_cutouts,
+            "unchanged": found_pngs - len(png_paths),
+            "cached": cached_cutouts,
+            "contour_vertices": contour_vertices,
+            "mesh_vertices": mesh_vertices,
+            "reused_images": reused_images,
+            "saved_bytes": saved_bytes,
+            "atlas_pages": atlas.page_paths if atlas is not None else [],
+            "objects": new_objects,
+            "elapsed_seconds": elapsed_time}
+
+### def_CLI for unattended batches: blender -b -P Pinguin_bl/__main__.py -- <directories> [options]
+### converts every directory into the same scene, writes it as a library .blend and prints (or writes) a json summary
+def main(argv):
+    parser = argparse.ArgumentParser(prog="blender -b -P Pinguin_bl/__main__.py --",
+                                     description="Turns the cutout pngs of one or more folders into meshes")
+    parser.add_argument("directories", nargs="+", help="folders with the cutout pngs")
+    parser.add_argument("--output", help="library .blend written with the converted cutouts (default: <first directory>/Pinguin.blend)")
+    parser.add_argument("--summary", help="also write the json summary to this file")
+    parser.add_argument("--height", type=float, default=1.7, help="mesh height in scene units")
+    parser.add_argument("--flat", action="store_true", help="do not stand the meshes up")
+    parser.add_argument("--holes", action="store_true", help="cut the inner holes of the cutouts")
+    parser.add_argument("--detailed", action="store_true", help="detailed contour algorithm instead of the fast one")
+    parser.add_argument("--workers", type=int, default=0, help="images processed at the same time, 0 uses every core")
+    parser.add_argument("--processes", action="store_true", help="run the workers in processes instead of threads (slower triangulation)")
+    parser.add_argument("--smooth", type=int, default=3, help="contour points averaged together, 1 disables smoothing")
+    parser.add_argument("--smooth-kernel", choices=["BOX", "GAUSSIAN"], default="BOX", help="weights of the smoothing average")
+    parser.add_argument("--simplify", type=float, default=0.0, help="simplification distance in scene units")
+    parser.add_argument("--max-vertices", type=int, default=0, help="contour vertices allowed per cutout")
+    parser.add_argument("--lods", type=int, default=0, help="simplified levels of detail per cutout")
+    parser.add_argument("--lod-error", type=float, default=0.005, help="simplification distance of the first LOD, x4 per level")
+    parser.add_argument("--crop", action="store_true", help="crop the textures to the cutouts")
+    parser.add_argument("--atlas", type=int, choices=[2048, 4096, 8192], help="pack the textures into atlas pages of this size")
+    parser.add_argument("--proxies", type=int, nargs="*", choices=[512, 1024, 2048], default=[], help="proxy texture sizes")
+    parser.add_argument("--no-cache", action="store_true", help="do not read or write the contour cache")
+    parser.add_argument("--sync", action="store_true", help="update the cutouts of the opened .blend (blender -b file.blend -P ...) instead of adding new ones")
+    parser.add_argument("--save-masks", action="store_true", help="also save the alpha masks in <directory>/Alpha Channel")
+    parser.add_argument("--profile", help="write the stage timings and counters of the whole batch to this json")
+    parser.add_argument("--trace", help="write the stage timings as a Chrome trace (chrome://tracing, ui.perfetto.dev)")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("--quiet", action="store_true", help="only log warnings and errors")
+    verbosity.add_argument("--verbose", action="store_true", help="log every cutout")
+    args = parser.parse_args(argv)
+
+    if args.quiet or args.verbose:
+        configure_logger("QUIET" if args.quiet else "DEBUG")
+
+    profiler = PipelineProfiler() if args.profile or args.trace else None
+
+    summaries = []
+    for directory in args.directories:
+        try:
+            summaries.append(convert_directory(directory,
+                                               mesh_height=args.height,
+                                               orient_vertical=not args.flat,
+                                               holes=args.holes,
+                                               algorithm=("NONE",) if args.detailed else ("SIMPLE",),
+                                               workers=args.workers,
+                                               pool="process" if args.processes else "thread",
+                                               smooth_window=args.smooth,
+                                               smooth_kernel=args.smooth_kernel,
+                                               simplify_error=args.simplify,
+                                               vertex_budget=args.max_vertices,
+                                               lod_levels=args.lods,
+                                               lod_error=args.lod_error,
+                                               sync=args.sync,
+                                               cache=not args.no_cache,
+                                               crop=args.crop,
+                                               atlas=args.atlas is not None,
+                                               atlas_size=args.atlas or 4096,
+                                               proxy_sizes=args.proxies,
+                                               save_alpha_masks=args.save_masks,
+                                               profiler=profiler))
+        # Any failure (Open-cv, a broken png, ...) only costs its own folder, the rest of the batch still runs
+        except Exception as error:
+            logger.error("%s could not be converted: %s", directory, error)
+            summaries.append({"directory": directory, "error": str(error)})
+
+    ### Every converted cutout (meshes, LODs, materials, node group and images by relative path) in a single library file
+    output_path = args.output or os.path.join(args.directories[0], "Pinguin.blend")
+    final_collection = bpy.data.collections.get("Pinguin-Cutout to Mesh")
+    if final_collection is not None:
+        bpy.data.libraries.write(output_path, {final_collection, *final_collection.objects}, path_remap="RELATIVE_ALL", fake_user=True)
+    else:
+        output_path = None
+
+    batch_summary = {"output": output_path, "directories": summaries}
+    if profiler is not None:
+        profiler.finish()
+        if args.profile:
+            profiler.write(args.profile)
+        if args.trace:
+            profiler.write(args.trace, chrome_trace=True)
+    if args.summary:
+        with open(args.summary, "w") as summary_file:
+            json.dump(batch_summary, summary_file, indent=2)
+    # Single line so job schedulers can grep it out of blender's own output
+    print("PINGUIN_SUMMARY " + json.dumps(batch_summary))
+    return 1 if any("error" in summary for summary in summaries) else 0
+
+### Blender_ Register and Unregister Classes   
+def register():
+    bpy.utils.register_class(PinguinPreferences)
+    bpy.utils.register_class(PREFERENCES_OT_pinguin_install_dependencies)
+    bpy.utils.register_class(MESH_OT_pinguin_create)
+    bpy.utils.register_class(MATERIAL_OT_pinguin_swap_textures)
+    bpy.utils.register_class(WM_OT_pinguin_export_profile)
+    bpy.utils.register_class(OBJECT_OT_pinguin_lod_by_distance)
+    bpy.utils.register_class(TRANSFORM_OT_face_towards)
+    bpy.utils.register_class(TRANSFORM_OT_face_towards_tilt)
+    bpy.utils.register_class(VIEW_PT_pinguin_create)
+    bpy.utils.register_class(VIEW_PT_pinguin_profile)
+    bpy.utils.register_class(VIEW_PT_facetowards)
+    bpy.utils.register_class(PinguinProperties)
+    
+    bpy.types.Scene.my_tool = bpy.props.PointerProperty(type = PinguinProperties)
+    
+    # Log preference of the add-on, run as a script (blender -P) there are no preferences and Info is used
+    addon = bpy.context.preferences.addons.get(__package__)
+    configure_logger(addon.preferences.log_level if addon is not None else "INFO")
+    
+def unregister():
+    bpy.utils.unregister_class(PinguinPreferences)
+    bpy.utils.unregister_class(PREFERENCES_OT_pinguin_install_dependencies)
+    bpy.utils.unregister_class(MESH_OT_pinguin_create)
+    bpy.utils.unregister_class(MATERIAL_OT_pinguin_swap_textures)
+    bpy.utils.unregister_class(WM_OT_pinguin_export_profile)
+    bpy.utils.unregister_class(OBJECT_OT_pinguin_lod_by_distance)
+    bpy.utils.unregister_class(TRANSFORM_OT_face_towards)
+    bpy.utils.unregister_class(TRANSFORM_OT_face_towards_tilt)
+    bpy.utils.unregister_class(VIEW_PT_pinguin_profile)
+    bpy.utils.unregister_class(VIEW_PT_pinguin_create)
+    bpy.utils.unregister_class(VIEW_PT_facetowards)
+    bpy.utils.unregister_class(PinguinProperties)   
+
+    del bpy.types.Scene.my_tool
@@ -0,0 +1,20 @@
+### Pinguin_bl.core, the cutout to mesh pipeline without Blender
+### everything from a folder of pngs to triangulated contours in mesh coordinates, bpy is never imported here
+### (Pillow, Open-cv and Numpy are only imported when a function needs them, Blender's mathutils only where it exists)
+from .atlas import ShelfPacker, atlas_padding, atlas_uv_transform, fits_atlas_page
+from .cache import (contour_cache_version, contour_settings_hash, cutout_object_is_current, cutout_settings_hash,
+                    file_content_hash, load_cached_cutout, prune_cutout_cache, save_cached_cutout)
+from .contours import (alpha_channel_threshold, alpha_channel_to_contour, bbox_extent_verts, binary_mask_contours,
+                       blender_scanfill, contour_blur_kernel, contour_hierarchy_levels, contour_pixel_bbox,
+                       contour_polygons, contour_threshold, contour_vertex_count, dim_to_extent_verts,
+                       image_to_mesh_coordinates, orient_counterclockwise, point_rolling_average,
+                       remove_repeated_points, scale_contour, simplify_contours, simplify_contours_to_budget,
+                       smoothing_kernel, triangulate_contours, triangulator_name)
+from .images import image_png_paths, image_rgba, proxy_texture_path, save_alpha_mask, save_proxy_textures
+from .earcut import earcut_polygon
+from .lazy import Image, LazyModule, cv, geometry, np
+from .log import RateLimitedLog, configure_logger, item_log, log_levels, logger
+from .pipeline import (cutout_lods, iter_cutouts, lod_level_for_distance, process_cutout, worker_pools,
+                       write_cutout_textures)
+from .profiler import PipelineProfiler, null_profiler
+from .vectors import cross_product_3d, dot_product, flip_vector, normalize_vector, project_vector_onto_plane
@@ -0,0 +1,60 @@
+### Texture atlas layout, pure python: where each cutout goes in a page and how its UVs follow it
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Tuple
+
+# Pixel rectangle (x0, y0, x1, y1), origin at the top left like the images
+BBox = Tuple[int, int, int, int]
+
+# Pixels left after every cutout of a page so the texture filtering of one never bleeds into the next
+atlas_padding = 2
+
+
+### def_online rectangle packer for the atlas pages: rows (shelves) as tall as the first rectangle placed in them,
+### each rectangle goes into the lowest shelf it fits in or opens a new one, rectangles are never moved
+class ShelfPacker:
+    def __init__(self, width: int, height: int, padding: int = 0) -> None:
+        self.width = width
+        self.height = height
+        self.padding = padding
+        self.shelves: List[List[int]] = [] # [y, height, used width]
+        self.used_height = 0
+
+    ### returns the (x, y) top left corner given to the rectangle or None when the page has no room left
+    def insert(self, width: int, height: int) -> Optional[Tuple[int, int]]:
+        width += self.padding
+        height += self.padding
+
+        best_shelf = None
+        for shelf in self.shelves:
+            shelf_y, shelf_height, shelf_x = shelf
+            if height <= shelf_height and shelf_x + width <= self.width:
+                if best_shelf is None or shelf_height < best_shelf[1]:
+                    best_shelf = shelf
+
+        if best_shelf is None:
+            if width > self.width or self.used_height + height > self.height:
+                return None
+            best_shelf = [self.used_height, height, 0]
+            self.shelves.append(best_shelf)
+            self.used_height += height
+
+        position = (best_shelf[2], best_shelf[0])
+        best_shelf[2] += width
+        return position
+
+### def_True when the bbox fits in an empty page, the larger cutouts keep a texture of their own
+def fits_atlas_page(bbox: BBox, page_size: int, padding: int = atlas_padding) -> bool:
+    x0, y0, x1, y1 = bbox
+    return x1 - x0 + padding <= page_size and y1 - y0 + padding <= page_size
+
+### def_scale and offset that take the UVs of a whole image (0-1, origin bottom left) to the bbox region of it
+### copied at position (top left, in pixels) into a square page of page_size pixels
+def atlas_uv_transform(dimensions: Sequence[int], bbox: BBox, position: Tuple[int, int],
+                       page_size: int) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+    img_height, img_width = dimensions[:2]
+    x0, y0, x1, y1 = bbox
+    page_x, page_y = position
+    scale = (img_width / page_size, img_height / page_size)
+    offset = ((page_x - x0) / page_size, (page_size - page_y - (y1 - y0) - (img_height - y1)) / page_size)
+    return scale, offset
@@ -0,0 +1,122 @@
+### Contour cache: processed cutouts stored per image as .npz files and keyed by content and settings
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import zipfile
+from typing import Any, Dict, Optional, Sequence
+
+from .contours import contour_blur_kernel, contour_threshold, triangulator_name
+from .lazy import np
+from .log import logger
+
+# A processed cutout (see process_cutout) and the settings dict it is made with
+Cutout = Dict[str, Any]
+Settings = Dict[str, Any]
+
+# Bump when the cached arrays change so older cache files are ignored
+contour_cache_version = 4
+
+### def_hash of the png bytes, identifies a cutout whatever its name or modification time
+def file_content_hash(file_bytes: bytes) -> str:
+    return hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+
+### def_True when the object was made from this same png modification time and settings, the png is not even read
+### obj is anything read like a dict, the custom properties of a blender object in the add-on
+def cutout_object_is_current(obj: Any, png_mtime: float, settings_hash: str) -> bool:
+    if obj is None:
+        return False
+    return obj.get("pinguin_mtime") == png_mtime and obj.get("pinguin_settings") == settings_hash
+
+### def_hash of everything besides the image that changes the cached contours and triangles, the contour cache key
+### LODs and textures (cropped or not) are made again after every cache load and the cached extents are always the ones
+### of the whole image, so their settings are left out (see cutout_settings_hash)
+def contour_settings_hash(settings: Settings) -> str:
+    fingerprint = [contour_cache_version,
+                   contour_blur_kernel,
+                   contour_threshold,
+                   sorted(settings["algorithm"]),
+                   settings["smooth_window"],
+                   settings["smooth_kernel"],
+                   settings["mesh_height"],
+                   settings.get("holes", False),
+                   settings.get("simplify_error", 0.0),
+                   settings.get("vertex_budget", 0),
+                   triangulator_name()]
+    return hashlib.blake2b(json.dumps(fingerprint).encode(), digest_size=8).hexdigest()
+
+### def_hash of everything besides the image that changes a converted cutout object, tagged on the objects for sync
+def cutout_settings_hash(settings: Settings) -> str:
+    fingerprint = [contour_settings_hash(settings),
+                   settings.get("lod_errors", []),
+                   settings.get("crop_path") is not None,
+                   sorted(settings.get("proxy_sizes", [])),
+                   settings.get("atlas_size", 0)]
+    return hashlib.blake2b(json.dumps(fingerprint).encode(), digest_size=8).hexdigest()
+
+### def_writes the arrays of a processed cutout into a single uncompressed .npz file, contours are stored
+### concatenated with their lengths, the file is written aside and then swapped so a crash never leaves half a file
+def save_cached_cutout(cache_file: str, cache_key: str, cutout: Cutout) -> None:
+    cached_arrays = {"key": np.array(cache_key),
+                     "dimensions": np.array(cutout["dimensions"]),
+                     "bbox": np.array(cutout["bbox"]),
+                     "vertex_counts": np.array(cutout["vertex_counts"]),
+                     "hierarchy": cutout["hierarchy"],
+                     "extents": cutout["extents"],
+                     "triangles": cutout["triangles"]}
+    for contours_key in ("verts", "mesh_verts"):
+        contours = cutout[contours_key]
+        cached_arrays[contours_key + "_lengths"] = np.array([len(contour) for contour in contours], dtype=np.int64)
+        cached_arrays[contours_key] = np.concatenate(contours) if contours else np.empty((0, 3), dtype=np.float32)
+
+    temporary_file = cache_file + ".tmp"
+    try:
+        with open(temporary_file, "wb") as npz_file:
+            np.savez(npz_file, **cached_arrays)
+        os.replace(temporary_file, cache_file)
+    except OSError as error:
+        # Read only cutouts folder, the cutout is just processed again next time
+        logger.debug("Contour cache not written: %s", error)
+
+### def_reads a processed cutout back, returns None when the file is missing, broken or was made from another image or settings
+def load_cached_cutout(cache_file: str, cache_key: str) -> Optional[Cutout]:
+    if not os.path.exists(cache_file):
+        return None
+    try:
+        with np.load(cache_file) as cached_arrays:
+            if str(cached_arrays["key"]) != cache_key:
+                return None
+            cutout = {"dimensions": tuple(cached_arrays["dimensions"].tolist()),
+                      "bbox": tuple(cached_arrays["bbox"].tolist()),
+                      "vertex_counts": tuple(cached_arrays["vertex_counts"].tolist()),
+                      "hierarchy": cached_arrays["hierarchy"],
+                      "extents": cached_arrays["extents"],
+                      "triangles": cached_arrays["triangles"]}
+            for contours_key in ("verts", "mesh_verts"):
+                contour_lengths = cached_arrays[contours_key + "_lengths"]
+                contour_points = cached_arrays[contours_key]
+                if len(contour_lengths) == 0:
+                    cutout[contours_key] = []
+                else:
+                    cutout[contours_key] = np.split(contour_points, np.cumsum(contour_lengths)[:-1])
+            return cutout
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+
+### def_deletes the cache files of pngs that are no longer in the folder (deleted or renamed, a renamed png is processed
+### again under its new name), and any .tmp left by a crash, returns how many files were removed
+def prune_cutout_cache(cache_path: str, png_paths: Sequence[str]) -> int:
+    png_names = {os.path.basename(png_path)[:-4] for png_path in png_paths}
+    pruned_files = 0
+    for cache_name in os.listdir(cache_path):
+        if cache_name.endswith(".npz") and cache_name[:-4] in png_names:
+            continue
+        if not cache_name.endswith((".npz", ".npz.tmp")):
+            continue
+        try:
+            os.remove(os.path.join(cache_path, cache_name))
+            pruned_files += 1
+        except OSError as error:
+            logger.debug("Contour cache file not removed: %s", error)
+    return pruned_files
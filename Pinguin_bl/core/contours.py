@@ -0,0 +1,281 @@
+### Contour math: from an alpha channel to smoothed, simplified and triangulated contours in mesh coordinates
+### every function works on numpy arrays, (N,3) float points per contour and the (N,4) open-cv hierarchy
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Collection, List, Optional, Sequence, Tuple
+
+from .atlas import BBox
+from .earcut import earcut_polygon
+from .lazy import cv, geometry, np
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+    from numpy.typing import ArrayLike
+
+
+### Contour search parameters, they are also part of the contour cache key
+contour_blur_kernel = (5, 5)
+contour_threshold = 127 #200 for contract #100 For expand ###200-Contrats
+
+### def_uses Computer Vision to turn an alpha channel (single channel array) into its outermost contours
+def alpha_channel_to_contour(opacity_map: ndarray, algorithm_set_toogle: Collection[str]) -> Tuple[Sequence[ndarray], Optional[ndarray], Tuple[int, ...]]:
+    contours, hierarchies = binary_mask_contours(alpha_channel_threshold(opacity_map), algorithm_set_toogle)
+    ###Extrae las dimensiones (height, width)
+    dimensions = opacity_map.shape
+        
+    return contours, hierarchies, dimensions   
+
+### def_first half of alpha_channel_to_contour, the alpha channel as a binary mask
+def alpha_channel_threshold(opacity_map: ndarray) -> ndarray:
+    ### Procesa el contorno
+    ### Aplica un blur para suavisarlo pero tambien para usar un mayor umbral(Thresh) y contraer el contorno
+    blur = cv.blur(opacity_map, contour_blur_kernel)
+    ret, thresh = cv.threshold(blur, contour_threshold, 255, cv.THRESH_BINARY)
+    return thresh
+
+### def_second half of alpha_channel_to_contour, the contours and their hierarchy found in a binary mask
+def binary_mask_contours(thresh: ndarray, algorithm_set_toogle: Collection[str]) -> Tuple[Sequence[ndarray], Optional[ndarray]]:
+    ### Decide que algoritmo usar para encontrar contornos    
+    if "SIMPLE" in algorithm_set_toogle:
+        return cv.findContours(thresh, cv.RETR_TREE, cv.CHAIN_APPROX_SIMPLE) ### Cambiar CHAIN_APROX_NONE o CHAIN_APPROX_SIMPLE
+    elif "NONE" in algorithm_set_toogle:
+        return cv.findContours(thresh, cv.RETR_TREE, cv.CHAIN_APPROX_NONE) ### Cambiar CHAIN_APROX_NONE o CHAIN_APPROX_SIMPLE 
+
+### def_Cyclic rolling average of a closed contour, takes a (N,1,2) open-cv contour or any (N,2)/(N,3) points
+### and returns a (N,3) array of the same length with the points smoothed (z is 0 for 2d points)
+### each point is averaged with the window-1 points that follow it, wrapping around the end of the contour
+def point_rolling_average(points: ArrayLike, window: int = 3, kernel: str = "BOX") -> ndarray:
+
+    points = np.asarray(points, dtype=np.float64)
+    list_lenght = len(points)
+    xyz_points = np.zeros((list_lenght, 3))
+    if list_lenght == 0:
+        return xyz_points
+
+    points = points.reshape(list_lenght, -1)
+    xyz_points[:, :min(points.shape[1], 3)] = points[:, :3]
+
+    ### Short contours are averaged with all of their points
+    window = max(1, min(window, list_lenght))
+    weights = smoothing_kernel(window, kernel)
+
+    ### Wraps the first points after the last one and adds each shifted copy once, O(n * window)
+    wrapped_points = np.concatenate((xyz_points, xyz_points[:window - 1]))
+    average_points = np.zeros_like(xyz_points)
+    for offset in range(window):
+        average_points += weights[offset] * wrapped_points[offset:offset + list_lenght]
+    average_points /= weights.sum()
+
+    return np.round(average_points, 2)
+
+### def_weights of the rolling average window, BOX is a plain mean and GAUSSIAN favours the middle of the window
+def smoothing_kernel(window: int, kernel: str = "BOX") -> ndarray:
+    if kernel == "BOX":
+        return np.ones(window)
+    elif kernel == "GAUSSIAN":
+        offsets = np.arange(window) - (window - 1) / 2
+        sigma = max(window / 4, 0.5)
+        return np.exp(-0.5 * (offsets / sigma) ** 2)
+    raise ValueError(f"Unknown smoothing kernel '{kernel}'. smoothing_kernel()")
+
+### def_Douglas-Peucker simplification of closed (N,3) contours with open-cv approxPolyDP, tolerance in the units of the points
+### contours that would end up with less than 3 points collapse to a triangle of their own points (one every third of the
+### contour) so they still match the hierarchy, a higher tolerance never gives more points than a lower one
+def simplify_contours(contours: List[ndarray], tolerance: float) -> List[ndarray]:
+    if tolerance <= 0:
+        return contours
+    simplified_contours = []
+    for contour in contours:
+        if len(contour) > 3:
+            approx_points = cv.approxPolyDP(contour[:, :2].astype(np.float32).reshape(-1, 1, 2), tolerance, True).reshape(-1, 2)
+            if len(approx_points) >= 3:
+                contour = np.column_stack((approx_points, np.zeros(len(approx_points)))).astype(contour.dtype)
+            else:
+                contour = contour[[0, len(contour) // 3, len(contour) * 2 // 3]]
+        simplified_contours.append(contour)
+    return simplified_contours
+
+### def_total number of points of a list of contours
+def contour_vertex_count(contours: Sequence[ndarray]) -> int:
+    return sum(len(contour) for contour in contours)
+
+### def_simplifies with the given tolerance and, when the result is still over vertex_budget (0 = no budget), raises the
+### tolerance only as much as needed: doubling it until the contours fit and then bisecting between the last two values
+### Douglas-Peucker is not strictly monotonic, so the lowest tolerance seen within the budget is the one returned
+def simplify_contours_to_budget(contours: List[ndarray], tolerance: float, vertex_budget: int = 0,
+                                bisect_steps: int = 12) -> List[ndarray]:
+    simplified_contours = simplify_contours(contours, tolerance)
+    if vertex_budget <= 0 or contour_vertex_count(simplified_contours) <= vertex_budget:
+        return simplified_contours
+
+    best_contours = None
+    low_tolerance, high_tolerance = tolerance, max(tolerance * 2, 1.0)
+    for _ in range(32):
+        simplified_contours = simplify_contours(contours, high_tolerance)
+        if contour_vertex_count(simplified_contours) <= vertex_budget:
+            best_contours = simplified_contours
+            break
+        low_tolerance, high_tolerance = high_tolerance, high_tolerance * 2
+    else:
+        # Every contour is down to its minimum (a triangle), the budget is too small for this cutout
+        return simplified_contours
+
+    for _ in range(bisect_steps):
+        middle_tolerance = (low_tolerance + high_tolerance) / 2
+        candidate_contours = simplify_contours(contours, middle_tolerance)
+        if contour_vertex_count(candidate_contours) <= vertex_budget:
+            high_tolerance, best_contours = middle_tolerance, candidate_contours
+        else:
+            low_tolerance = middle_tolerance
+    return best_contours
+
+### def_Takes (N,3) points and scales them using a desired factor, returns a float32 array
+def scale_contour(scontours: ArrayLike, scale_desired_factor: float) -> ndarray:
+    return np.asarray(scontours, dtype=np.float32) * np.float32(scale_desired_factor)
+
+### def_Takes (N,3) image points (y pointing down) and returns float32 mesh coordinates in a single array operation:
+### scaled, mirrored in y so the cutout is not reflected, and offset so the origin is the bottom left corner of the image
+def image_to_mesh_coordinates(points: ArrayLike, scale_factor: float, img_height: float) -> ndarray:
+    scale = np.array((scale_factor, -scale_factor, scale_factor), dtype=np.float32)
+    offset = np.array((0, img_height * scale_factor, 0), dtype=np.float32)
+    return np.asarray(points, dtype=np.float32) * scale + offset
+
+### def_Returns the contour points in counterclockwise order (seen from +z) so faces built from them point up
+def orient_counterclockwise(points: ndarray) -> ndarray:
+    x = points[:, 0].astype(np.float64)
+    y = points[:, 1].astype(np.float64)
+    # Shoelace formula, positive for counterclockwise polygons
+    signed_area = np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))
+    if signed_area < 0:
+        return points[::-1].copy()
+    return points
+
+### def_Groups contours into polygons: lists of contour indices where the first one is the outline and the rest its holes
+### takes the open-cv hierarchy, one (next, previous, first child, parent) row per contour
+### without holes every outermost contour is a polygon on its own, with holes every contour at an even nesting level
+### (silhouettes, islands inside holes, ...) is an outline and its children at the next level are the holes
+def contour_polygons(hierarchy: ArrayLike, holes: bool = False) -> List[List[int]]:
+    hierarchy = np.asarray(hierarchy).reshape(-1, 4)
+    if not holes:
+        return [[contour_index] for contour_index in np.flatnonzero(hierarchy[:, 3] == -1)]
+
+    hierarchy_level_list = contour_hierarchy_levels(hierarchy)[0]
+    next_contours = hierarchy[:, 0].tolist()
+    first_children = hierarchy[:, 2].tolist()
+    polygons = []
+    for contour_index in np.flatnonzero(hierarchy_level_list % 2 == 0).tolist():
+        polygon = [contour_index]
+        ### Walks the children chain, every contour is visited once as a hole
+        child_index = first_children[contour_index]
+        while child_index != -1:
+            polygon.append(child_index)
+            child_index = next_contours[child_index]
+        polygons.append(polygon)
+    return polygons
+
+### def_Single pass over the open-cv hierarchy, O(n): walks every chain of siblings once starting from the outermost one
+### returns the nesting level of every contour (0 for the outermost ones) and the contour indices of each level
+def contour_hierarchy_levels(hierarchy: ArrayLike) -> Tuple[ndarray, List[ndarray]]:
+    hierarchy = np.asarray(hierarchy).reshape(-1, 4)
+    hierarchy_level_list = np.zeros(len(hierarchy), dtype=np.int32)
+    level_buckets = []
+    next_contours = hierarchy[:, 0].tolist()
+    first_children = hierarchy[:, 2].tolist()
+
+    # Chains still to walk as (first contour, level), the outermost chain starts with the contour without previous nor parent
+    outermost_heads = np.flatnonzero((hierarchy[:, 1] == -1) & (hierarchy[:, 3] == -1)).tolist()
+    pending = [(contour_index, 0) for contour_index in outermost_heads]
+    while pending:
+        contour_index, hierarchy_level = pending.pop()
+        while len(level_buckets) <= hierarchy_level:
+            level_buckets.append([])
+        while contour_index != -1:
+            hierarchy_level_list[contour_index] = hierarchy_level
+            level_buckets[hierarchy_level].append(contour_index)
+            if first_children[contour_index] != -1:
+                pending.append((first_children[contour_index], hierarchy_level + 1))
+            contour_index = next_contours[contour_index]
+
+    return hierarchy_level_list, [np.array(bucket, dtype=np.int32) for bucket in level_buckets]
+
+### def_blender's scanfill (mathutils.geometry.tessellate_polygon) when it exists, None elsewhere:
+### the standalone mathutils wheels are built without it and Blender's worker processes have no mathutils at all
+@functools.lru_cache(maxsize=None)
+def blender_scanfill():
+    try:
+        return geometry.tessellate_polygon
+    except (ImportError, AttributeError):
+        return None
+
+### def_"scanfill" or "earcut", the triangulator triangulate_contours uses in this process (their triangles differ)
+def triangulator_name() -> str:
+    return "earcut" if blender_scanfill() is None else "scanfill"
+
+### def_Triangulates polygons (outline + holes) before any object exists, with blender's scanfill when it is there
+### and with the plain python ear clipping of earcut.py everywhere else
+### returns the contours that were used and a (T,3) int32 array of counterclockwise triangles indexing their concatenated points
+def triangulate_contours(contours_list: Sequence[ndarray], polygons: List[List[int]]) -> Tuple[List[ndarray], ndarray]:
+    polygon_contours = []
+    triangles = []
+    vertex_offset = 0
+
+    for polygon in polygons:
+        ### Contours with less than 3 distinct points can not enclose anything
+        polygon_verts = [remove_repeated_points(contours_list[contour_index]) for contour_index in polygon]
+        if len(polygon_verts[0]) < 3:
+            continue
+        polygon_verts = [each_vert for each_vert in polygon_verts if len(each_vert) > 2]
+        tessellate_polygon = blender_scanfill()
+        if tessellate_polygon is not None:
+            polygon_triangles = np.array(tessellate_polygon([each_vert.tolist() for each_vert in polygon_verts]), dtype=np.int32)
+        else:
+            polygon_triangles = earcut_polygon(polygon_verts)
+        triangles.append(polygon_triangles.reshape(-1, 3) + vertex_offset)
+        polygon_contours.extend(polygon_verts)
+        vertex_offset += sum(len(each_vert) for each_vert in polygon_verts)
+
+    if not triangles:
+        return polygon_contours, np.empty((0, 3), dtype=np.int32)
+    triangles = np.concatenate(triangles)
+
+    ### Neither scanfill nor earcut keep a winding, clockwise triangles are flipped so every normal points +z
+    points = np.concatenate(polygon_contours)
+    corner_a = points[triangles[:, 0], :2]
+    edge_b = points[triangles[:, 1], :2] - corner_a
+    edge_c = points[triangles[:, 2], :2] - corner_a
+    clockwise = edge_b[:, 0] * edge_c[:, 1] - edge_b[:, 1] * edge_c[:, 0] < 0
+    triangles[clockwise] = triangles[clockwise][:, ::-1]
+
+    return polygon_contours, triangles
+
+### def_Drops points equal to the previous one (the last one is compared with the first), scanfill can not handle them
+def remove_repeated_points(points: ndarray) -> ndarray:
+    if len(points) < 2:
+        return points
+    repeated = np.all(points == np.roll(points, 1, axis=0), axis=1)
+    if repeated.any():
+        return points[~repeated]
+    return points
+
+### def_dimensions to extent vertices
+def dim_to_extent_verts(dimension: Sequence[int]) -> List[List[int]]:
+    d_width = dimension[0]
+    d_height = dimension[1]
+    extents = [[0,0,0],[0,d_width,0],[d_height,0,0],[d_height,d_width,0]]
+    return extents
+
+### def_bbox to extent vertices, same corner order as dim_to_extent_verts
+def bbox_extent_verts(bbox: BBox) -> List[List[int]]:
+    x0, y0, x1, y1 = bbox
+    return [[x0,y0,0],[x0,y1,0],[x1,y0,0],[x1,y1,0]]
+
+### def_pixel rectangle (x0, y0, x1, y1) that holds every contour plus a margin, the whole image when there are none
+def contour_pixel_bbox(contours: Sequence[ArrayLike], dimensions: Sequence[int], margin: int = 2) -> BBox:
+    img_height, img_width = dimensions[:2]
+    if len(contours) == 0:
+        return (0, 0, img_width, img_height)
+    points = np.concatenate([np.asarray(contour).reshape(-1, 2) for contour in contours])
+    x0, y0 = points.min(axis=0) - margin
+    x1, y1 = points.max(axis=0) + 1 + margin
+    return (int(max(x0, 0)), int(max(y0, 0)), int(min(x1, img_width)), int(min(y1, img_height)))
@@ -0,0 +1,484 @@
+### Ear clipping triangulation of polygons with holes, plain python so the core triangulates without Blender
+### port of mapbox's earcut (https://github.com/mapbox/earcut): holes are bridged into the outline,
+### then ears are clipped from a doubly linked ring, with a z-order curve index for large polygons
+#
+# earcut is distributed under the ISC License:
+#
+# Copyright (c) 2016, Mapbox
+#
+# Permission to use, copy, modify, and/or distribute this software for any purpose
+# with or without fee is hereby granted, provided that the above copyright notice
+# and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND ISC DISCLAIMS ALL WARRANTIES WITH REGARD TO
+# THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS.
+# IN NO EVENT SHALL ISC BE LIABLE FOR ANY SPECIAL, DIRECT, INDIRECT, OR
+# CONSEQUENTIAL DAMAGES OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA
+# OR PROFITS, WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+from .lazy import np
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+
+
+### def_vertex of the ring being clipped, i is its index in the concatenated outline + holes points
+class EarcutNode:
+    __slots__ = ("i", "x", "y", "prev", "next", "z", "prev_z", "next_z", "steiner")
+
+    def __init__(self, i: int, x: float, y: float) -> None:
+        self.i = i
+        self.x = x
+        self.y = y
+        self.prev: Optional[EarcutNode] = None
+        self.next: Optional[EarcutNode] = None
+        self.z = 0
+        self.prev_z: Optional[EarcutNode] = None
+        self.next_z: Optional[EarcutNode] = None
+        self.steiner = False
+
+### def_triangulates an outline and its holes, each a (N,2) or (N,3) array of points (only x and y are used)
+### returns a (T,3) int32 array of triangles indexing the points of every contour concatenated in the given order
+def earcut_polygon(polygon_verts: Sequence[ndarray]) -> ndarray:
+    coordinates = []
+    ring_starts = []
+    for each_vert in polygon_verts:
+        ring_starts.append(len(coordinates))
+        coordinates.extend(np.asarray(each_vert, dtype=np.float64)[:, :2].tolist())
+    triangles = earcut(coordinates, ring_starts[1:])
+    return np.array(triangles, dtype=np.int32).reshape(-1, 3)
+
+### def_earcut on a list of [x, y] points where hole_starts are the indices where every hole begins, flat triangle indices
+def earcut(coordinates: List[List[float]], hole_starts: Sequence[int] = ()) -> List[int]:
+    outer_end = hole_starts[0] if hole_starts else len(coordinates)
+    outer_node = linked_ring(coordinates, 0, outer_end, True)
+    triangles: List[int] = []
+    if outer_node is None or outer_node.next is outer_node.prev:
+        return triangles
+
+    if hole_starts:
+        outer_node = eliminate_holes(coordinates, hole_starts, outer_node)
+
+    ### Large polygons look for points inside an ear through a z-order curve instead of the whole ring
+    min_x = min_y = inv_size = 0.0
+    if len(coordinates) > 80:
+        xs = [point[0] for point in coordinates[:outer_end]]
+        ys = [point[1] for point in coordinates[:outer_end]]
+        min_x, min_y = min(xs), min(ys)
+        inv_size = max(max(xs) - min_x, max(ys) - min_y)
+        inv_size = 32767 / inv_size if inv_size else 0.0
+
+    earcut_linked(outer_node, triangles, min_x, min_y, inv_size, 0)
+    return triangles
+
+### def_circular doubly linked list of a ring in the given winding, None when it is empty
+def linked_ring(coordinates, start, end, clockwise):
+    last = None
+    if clockwise == (signed_area(coordinates, start, end) > 0):
+        indices = range(start, end)
+    else:
+        indices = range(end - 1, start - 1, -1)
+    for i in indices:
+        last = insert_node(i, coordinates[i][0], coordinates[i][1], last)
+    if last is not None and equals(last, last.next):
+        remove_node(last)
+        last = last.next
+    return last
+
+def signed_area(coordinates, start, end):
+    total = 0.0
+    j = end - 1
+    for i in range(start, end):
+        total += (coordinates[j][0] - coordinates[i][0]) * (coordinates[i][1] + coordinates[j][1])
+        j = i
+    return total
+
+### def_removes repeated and collinear points
+def filter_points(start, end=None):
+    if start is None:
+        return start
+    if end is None:
+        end = start
+    p = start
+    while True:
+        again = False
+        if not p.steiner and (equals(p, p.next) or area(p.prev, p, p.next) == 0):
+            remove_node(p)
+            p = end = p.prev
+            if p is p.next:
+                break
+            again = True
+        else:
+            p = p.next
+        if not again and p is end:
+            break
+    return end
+
+### def_main ear slicing loop, when no ear is left it filters the ring, cures self intersections and finally splits it in two
+def earcut_linked(ear, triangles, min_x, min_y, inv_size, ear_pass):
+    if ear is None:
+        return
+    if not ear_pass and inv_size:
+        index_curve(ear, min_x, min_y, inv_size)
+
+    stop = ear
+    while ear.prev is not ear.next:
+        prev_node = ear.prev
+        next_node = ear.next
+        # Reflex corners are most of the failed ears, they are rejected here without a call (see area)
+        convex = (ear.y - prev_node.y) * (next_node.x - ear.x) - (ear.x - prev_node.x) * (next_node.y - ear.y) < 0
+        if convex and (is_ear_hashed(ear, min_x, min_y, inv_size) if inv_size else is_ear(ear)):
+            triangles.extend((prev_node.i, ear.i, next_node.i))
+            remove_node(ear)
+            # Skipping the next vertex leads to less sliver triangles
+            ear = next_node.next
+            stop = next_node.next
+            continue
+
+        ear = next_node
+        if ear is stop:
+            if not ear_pass:
+                earcut_linked(filter_points(ear), triangles, min_x, min_y, inv_size, 1)
+            elif ear_pass == 1:
+                ear = cure_local_intersections(filter_points(ear), triangles)
+                earcut_linked(ear, triangles, min_x, min_y, inv_size, 2)
+            elif ear_pass == 2:
+                split_earcut(ear, triangles, min_x, min_y, inv_size)
+            break
+
+### def_True when no other point of the ring lies inside the triangle made by the ear and its neighbours
+def is_ear(ear):
+    a, b, c = ear.prev, ear, ear.next
+    if area(a, b, c) >= 0:
+        return False # reflex
+
+    ax, ay, bx, by, cx, cy = a.x, a.y, b.x, b.y, c.x, c.y
+    x0, y0, x1, y1 = min(ax, bx, cx), min(ay, by, cy), max(ax, bx, cx), max(ay, by, cy)
+    p = c.next
+    while p is not a:
+        if (x0 <= p.x <= x1 and y0 <= p.y <= y1 and point_in_triangle(ax, ay, bx, by, cx, cy, p.x, p.y)
+                and area(p.prev, p, p.next) >= 0):
+            return False
+        p = p.next
+    return True
+
+### def_is_ear that only visits the points whose z-order falls within the bounding box of the ear
+def is_ear_hashed(ear, min_x, min_y, inv_size):
+    a, b, c = ear.prev, ear, ear.next
+    if area(a, b, c) >= 0:
+        return False # reflex
+
+    ax, ay, bx, by, cx, cy = a.x, a.y, b.x, b.y, c.x, c.y
+    x0, y0, x1, y1 = min(ax, bx, cx), min(ay, by, cy), max(ax, bx, cx), max(ay, by, cy)
+    min_z = z_order(x0, y0, min_x, min_y, inv_size)
+    max_z = z_order(x1, y1, min_x, min_y, inv_size)
+
+    def inside(p):
+        return (x0 <= p.x <= x1 and y0 <= p.y <= y1 and p is not a and p is not c
+                and point_in_triangle(ax, ay, bx, by, cx, cy, p.x, p.y) and area(p.prev, p, p.next) >= 0)
+
+    # Looks in both directions of the z-order at once
+    p = ear.prev_z
+    n = ear.next_z
+    while p is not None and p.z >= min_z and n is not None and n.z <= max_z:
+        if inside(p):
+            return False
+        p = p.prev_z
+        if inside(n):
+            return False
+        n = n.next_z
+    while p is not None and p.z >= min_z:
+        if inside(p):
+            return False
+        p = p.prev_z
+    while n is not None and n.z <= max_z:
+        if inside(n):
+            return False
+        n = n.next_z
+    return True
+
+### def_clips the small self intersections a ring can have after its holes were bridged
+def cure_local_intersections(start, triangles):
+    p = start
+    while True:
+        a = p.prev
+        b = p.next.next
+        if not equals(a, b) and intersects(a, p, p.next, b) and locally_inside(a, b) and locally_inside(b, a):
+            triangles.extend((a.i, p.i, b.i))
+            remove_node(p)
+            remove_node(p.next)
+            p = start = b
+        p = p.next
+        if p is start:
+            break
+    return filter_points(p)
+
+### def_last resort, splits the ring by a valid diagonal and triangulates both halves
+def split_earcut(start, triangles, min_x, min_y, inv_size):
+    a = start
+    while True:
+        b = a.next.next
+        while b is not a.prev:
+            if a.i != b.i and is_valid_diagonal(a, b):
+                c = split_polygon(a, b)
+                a = filter_points(a, a.next)
+                c = filter_points(c, c.next)
+                earcut_linked(a, triangles, min_x, min_y, inv_size, 0)
+                earcut_linked(c, triangles, min_x, min_y, inv_size, 0)
+                return
+            b = b.next
+        a = a.next
+        if a is start:
+            return
+
+### def_links every hole into the outline through a bridge, from the leftmost hole to the rightmost one
+def eliminate_holes(coordinates, hole_starts, outer_node):
+    queue = []
+    for hole_number, start in enumerate(hole_starts):
+        end = hole_starts[hole_number + 1] if hole_number + 1 < len(hole_starts) else len(coordinates)
+        ring = linked_ring(coordinates, start, end, False)
+        if ring is None:
+            continue
+        if ring is ring.next:
+            ring.steiner = True
+        queue.append(get_leftmost(ring))
+    queue.sort(key=lambda node: node.x)
+    for hole in queue:
+        outer_node = eliminate_hole(hole, outer_node)
+    return outer_node
+
+def eliminate_hole(hole, outer_node):
+    bridge = find_hole_bridge(hole, outer_node)
+    if bridge is None:
+        return outer_node
+    bridge_reverse = split_polygon(bridge, hole)
+    filter_points(bridge_reverse, bridge_reverse.next)
+    return filter_points(bridge, bridge.next)
+
+### def_David Eberly's algorithm, the outline point the leftmost point of a hole can be connected to
+def find_hole_bridge(hole, outer_node):
+    p = outer_node
+    hx, hy = hole.x, hole.y
+    qx = -float("inf")
+    m = None
+
+    ### Segment of the outline left of the hole point and closest to it on a horizontal ray
+    while True:
+        if p.y >= hy >= p.next.y and p.next.y != p.y:
+            x = p.x + (hy - p.y) * (p.next.x - p.x) / (p.next.y - p.y)
+            if hx >= x > qx:
+                qx = x
+                m = p if p.x < p.next.x else p.next
+                if x == hx:
+                    # The hole touches the outline, the leftmost endpoint is the bridge
+                    return m
+        p = p.next
+        if p is outer_node:
+            break
+    if m is None:
+        return None
+
+    ### Points inside the triangle hole point - segment intersection - segment endpoint could block the bridge,
+    ### the one with the smallest angle to the ray is used instead
+    stop = m
+    mx, my = m.x, m.y
+    tan_min = float("inf")
+    p = m
+    while True:
+        if (hx >= p.x >= mx and hx != p.x
+                and point_in_triangle(hx if hy < my else qx, hy, mx, my, qx if hy < my else hx, hy, p.x, p.y)):
+            tan = abs(hy - p.y) / (hx - p.x)
+            if locally_inside(p, hole) and (tan < tan_min or (tan == tan_min and (p.x > m.x or
+                                                                                (p.x == m.x and sector_contains_sector(m, p))))):
+                m = p
+                tan_min = tan
+        p = p.next
+        if p is stop:
+            break
+    return m
+
+def sector_contains_sector(m, p):
+    return area(m.prev, m, p.prev) < 0 and area(p.next, m, m.next) < 0
+
+### def_z-order of every point, linked in that order through prev_z / next_z
+def index_curve(start, min_x, min_y, inv_size):
+    p = start
+    while True:
+        if p.z == 0:
+            p.z = z_order(p.x, p.y, min_x, min_y, inv_size)
+        p.prev_z = p.prev
+        p.next_z = p.next
+        p = p.next
+        if p is start:
+            break
+    p.prev_z.next_z = None
+    p.prev_z = None
+    sort_linked(p)
+
+### def_Simon Tatham's merge sort of the z-order list
+def sort_linked(head):
+    in_size = 1
+    while True:
+        p = head
+        head = None
+        tail = None
+        merges = 0
+        while p is not None:
+            merges += 1
+            q = p
+            p_size = 0
+            for _ in range(in_size):
+                p_size += 1
+                q = q.next_z
+                if q is None:
+                    break
+            q_size = in_size
+            while p_size > 0 or (q_size > 0 and q is not None):
+                if p_size != 0 and (q_size == 0 or q is None or p.z <= q.z):
+                    e = p
+                    p = p.next_z
+                    p_size -= 1
+                else:
+                    e = q
+                    q = q.next_z
+                    q_size -= 1
+                if tail is not None:
+                    tail.next_z = e
+                else:
+                    head = e
+                e.prev_z = tail
+                tail = e
+            p = q
+        tail.next_z = None
+        if merges <= 1:
+            return head
+        in_size *= 2
+
+### def_interleaves the bits of the 15 bit coordinates of a point
+def z_order(x, y, min_x, min_y, inv_size):
+    x = int((x - min_x) * inv_size)
+    y = int((y - min_y) * inv_size)
+    x = (x | (x << 8)) & 0x00FF00FF
+    x = (x | (x << 4)) & 0x0F0F0F0F
+    x = (x | (x << 2)) & 0x33333333
+    x = (x | (x << 1)) & 0x55555555
+    y = (y | (y << 8)) & 0x00FF00FF
+    y = (y | (y << 4)) & 0x0F0F0F0F
+    y = (y | (y << 2)) & 0x33333333
+    y = (y | (y << 1)) & 0x55555555
+    return x | (y << 1)
+
+def get_leftmost(start):
+    p = start
+    leftmost = start
+    while True:
+        if p.x < leftmost.x or (p.x == leftmost.x and p.y < leftmost.y):
+            leftmost = p
+        p = p.next
+        if p is start:
+            return leftmost
+
+def point_in_triangle(ax, ay, bx, by, cx, cy, px, py):
+    return ((cx - px) * (ay - py) >= (ax - px) * (cy - py)
+            and (ax - px) * (by - py) >= (bx - px) * (ay - py)
+            and (bx - px) * (cy - py) >= (cx - px) * (by - py))
+
+### def_a diagonal that stays inside the ring and crosses none of its edges
+def is_valid_diagonal(a, b):
+    return (a.next.i != b.i and a.prev.i != b.i and not intersects_polygon(a, b)
+            and ((locally_inside(a, b) and locally_inside(b, a) and middle_inside(a, b)
+                  and (area(a.prev, a, b.prev) != 0 or area(a, b.prev, b) != 0))
+                 or (equals(a, b) and area(a.prev, a, a.next) > 0 and area(b.prev, b, b.next) > 0)))
+
+### def_twice the signed area of a triangle
+def area(p, q, r):
+    return (q.y - p.y) * (r.x - q.x) - (q.x - p.x) * (r.y - q.y)
+
+def equals(p1, p2):
+    return p1.x == p2.x and p1.y == p2.y
+
+def sign(value):
+    return (value > 0) - (value < 0)
+
+def on_segment(p, q, r):
+    return max(p.x, r.x) >= q.x >= min(p.x, r.x) and max(p.y, r.y) >= q.y >= min(p.y, r.y)
+
+def intersects(p1, q1, p2, q2):
+    o1 = sign(area(p1, q1, p2))
+    o2 = sign(area(p1, q1, q2))
+    o3 = sign(area(p2, q2, p1))
+    o4 = sign(area(p2, q2, q1))
+    if o1 != o2 and o3 != o4:
+        return True
+    # Collinear cases
+    return ((o1 == 0 and on_segment(p1, p2, q1)) or (o2 == 0 and on_segment(p1, q2, q1))
+            or (o3 == 0 and on_segment(p2, p1, q2)) or (o4 == 0 and on_segment(p2, q1, q2)))
+
+def intersects_polygon(a, b):
+    p = a
+    while True:
+        if (p.i != a.i and p.next.i != a.i and p.i != b.i and p.next.i != b.i
+                and intersects(p, p.next, a, b)):
+            return True
+        p = p.next
+        if p is a:
+            return False
+
+def locally_inside(a, b):
+    if area(a.prev, a, a.next) < 0:
+        return area(a, b, a.next) >= 0 and area(a, a.prev, b) >= 0
+    return area(a, b, a.prev) < 0 or area(a, a.next, b) < 0
+
+### def_True when the middle of the diagonal a-b is inside the ring (even-odd rule)
+def middle_inside(a, b):
+    p = a
+    inside = False
+    px = (a.x + b.x) / 2
+    py = (a.y + b.y) / 2
+    while True:
+        if ((p.y > py) != (p.next.y > py) and p.next.y != p.y
+                and px < (p.next.x - p.x) * (py - p.y) / (p.next.y - p.y) + p.x):
+            inside = not inside
+        p = p.next
+        if p is a:
+            return inside
+
+### def_links a and b with a diagonal, the ring is split in two and the second one is returned
+def split_polygon(a, b):
+    a2 = EarcutNode(a.i, a.x, a.y)
+    b2 = EarcutNode(b.i, b.x, b.y)
+    an = a.next
+    bp = b.prev
+    a.next = b
+    b.prev = a
+    a2.next = an
+    an.prev = a2
+    b2.next = a2
+    a2.prev = b2
+    bp.next = b2
+    b2.prev = bp
+    return b2
+
+def insert_node(i, x, y, last):
+    p = EarcutNode(i, x, y)
+    if last is None:
+        p.prev = p
+        p.next = p
+    else:
+        p.next = last.next
+        p.prev = last
+        last.next.prev = p
+        last.next = p
+    return p
+
+def remove_node(p):
+    p.next.prev = p.prev
+    p.prev.next = p.next
+    if p.prev_z is not None:
+        p.prev_z.next_z = p.next_z
+    if p.next_z is not None:
+        p.next_z.prev_z = p.prev_z
@@ -0,0 +1,56 @@
+### Finding, decoding and writing the cutout pngs
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, BinaryIO, Iterable, List, Union
+
+from .lazy import Image
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+    from PIL.Image import Image as PILImage
+
+
+### def_returns list of pngs in folder
+def image_png_paths(dir: str) -> List[str]:
+
+    files_in_directory = os.listdir(dir)
+    image_paths = []
+    number_of_pngs = 0
+    number_of_files = 0
+
+    for image_png_name in files_in_directory:
+        if str(image_png_name).endswith(".png"):            
+            image_path = dir + "/" + image_png_name
+            image_paths.append(image_path)
+
+            number_of_pngs += 1
+            number_of_files += 1
+        else:
+            number_of_files += 1
+            pass
+
+    ###print("pngs found:", number_of_pngs, "of", number_of_files,"files\n")
+    return image_paths 
+
+### def_Decodes a single png as an RGBA image
+def image_rgba(img_path: Union[str, BinaryIO]) -> PILImage:
+    with Image.open(img_path) as img:
+        return img.convert("RGBA")
+
+### def_writes an alpha mask as a png, only used for debugging
+def save_alpha_mask(alpha: ndarray, result_path: str) -> None:
+    Image.fromarray(alpha).save(result_path)
+
+### def_path of the proxy of a texture, in a "Proxies/<size>" folder next to it and with the same file name
+def proxy_texture_path(texture_path: str, size: int) -> str:
+    return os.path.join(os.path.dirname(texture_path), "Proxies", str(size), os.path.basename(texture_path))
+
+### def_writes downscaled copies of an image (largest side = size, never upscaled) for viewport work
+def save_proxy_textures(image: PILImage, texture_path: str, sizes: Iterable[int]) -> None:
+    for size in sizes:
+        proxy_path = proxy_texture_path(texture_path, size)
+        os.makedirs(os.path.dirname(proxy_path), exist_ok=True)
+        proxy = image.copy()
+        proxy.thumbnail((size, size), Image.LANCZOS)
+        proxy.save(proxy_path)
@@ -0,0 +1,25 @@
+### Heavy modules of the core, none of them is imported until a conversion actually uses it
+import importlib
+
+
+### def_stand-in for a heavy module, the real import happens the first time one of its attributes is used
+### so registering the add-on never pays for Pillow, Open-cv or Numpy
+class LazyModule:
+    def __init__(self, module_name: str) -> None:
+        self.module_name = module_name
+        self.module = None
+
+    def __getattr__(self, attribute: str):
+        return getattr(self.load_module(), attribute)
+
+    # Named so they never shadow an attribute of the real module (numpy.load)
+    def load_module(self):
+        if self.module is None:
+            self.module = importlib.import_module(self.module_name)
+        return self.module
+
+Image = LazyModule("PIL.Image") # pip install Pillow
+cv = LazyModule("cv2") #pip install opencv-python
+np = LazyModule("numpy") #pip install numpy
+# Blender's own math module, only its scanfill is used and only where it exists (see blender_scanfill)
+geometry = LazyModule("mathutils.geometry")
@@ -0,0 +1,70 @@
+### Pinguin's log channel, a standard "pinguin" logger so Blender, the CLI and any host script pick the verbosity
+### messages use lazy % formatting (logger.debug("%s converted", name)), nothing is formatted below the active level
+from __future__ import annotations
+
+import logging
+import sys
+import time
+from typing import Any, Dict
+
+logger = logging.getLogger("pinguin")
+# Silent until configure_logger or the host application adds a handler
+logger.addHandler(logging.NullHandler())
+
+# Verbosity names used by the add-on preferences and the CLI, QUIET keeps only warnings and errors
+log_levels = {"QUIET": logging.WARNING,
+              "INFO": logging.INFO,
+              "DEBUG": logging.DEBUG}
+
+
+### def_sends the pinguin messages to stdout (Blender's console) at the given verbosity, safe to call again to change it
+def configure_logger(verbosity: str = "INFO") -> logging.Logger:
+    logger.setLevel(log_levels[verbosity])
+    if not any(getattr(handler, "pinguin_handler", False) for handler in logger.handlers):
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("Pinguin %(levelname)s: %(message)s"))
+        handler.pinguin_handler = True
+        logger.addHandler(handler)
+        # Blender or the host may also log from the root logger, each message is printed once
+        logger.propagate = False
+    return logger
+
+### def_per item messages (one per cutout or object) that may come thousands of times in a row
+### at most one message every interval seconds per key goes through, the rest are only counted and reported
+### with the next one that does, or left to the end of run summary
+class RateLimitedLog:
+    def __init__(self, log: logging.Logger = logger, interval: float = 1.0) -> None:
+        self.log = log
+        self.interval = interval
+        self.last_emitted: Dict[str, float] = {}
+        self.skipped: Dict[str, int] = {}
+
+    def __call__(self, level: int, key: str, message: str, *args: Any) -> None:
+        ### Quiet runs return here, before any clock read or formatting, debug runs show every message
+        if not self.log.isEnabledFor(level):
+            return
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.log(level, message, *args)
+            return
+        now = time.monotonic()
+        if now - self.last_emitted.get(key, -self.interval) < self.interval:
+            self.skipped[key] = self.skipped.get(key, 0) + 1
+            return
+        self.last_emitted[key] = now
+        skipped = self.skipped.pop(key, 0)
+        if skipped:
+            self.log.log(level, message + " (and %d more)", *args, skipped)
+        else:
+            self.log.log(level, message, *args)
+
+    ### "99 converted, 3 removed", the messages skipped since the last one of their key went through (for the end of run
+    ### summary), empty when none were
+    def skipped_summary(self) -> str:
+        return ", ".join(f"{skipped} {key}" for key, skipped in sorted(self.skipped.items()))
+
+    ### starts over, called when a new run begins
+    def reset(self) -> None:
+        self.last_emitted.clear()
+        self.skipped.clear()
+
+item_log = RateLimitedLog()
@@ -0,0 +1,269 @@
+### Streaming pipeline: every png goes alone from decode to a processed cutout, ready to be turned into a mesh
+### nothing here touches bpy, so it runs in worker processes (or threads) and outside Blender
+from __future__ import annotations
+
+import io
+import math
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence, Tuple
+
+from .atlas import fits_atlas_page
+from .cache import Cutout, Settings, contour_settings_hash, file_content_hash, load_cached_cutout, save_cached_cutout
+from .contours import (alpha_channel_threshold, bbox_extent_verts, binary_mask_contours, contour_pixel_bbox,
+                       contour_polygons, contour_vertex_count, dim_to_extent_verts, image_to_mesh_coordinates,
+                       orient_counterclockwise, point_rolling_average, simplify_contours, simplify_contours_to_budget,
+                       triangulate_contours, triangulator_name)
+from .images import image_rgba, proxy_texture_path, save_alpha_mask, save_proxy_textures
+from .lazy import np
+from .log import logger
+from .profiler import PipelineProfiler, null_profiler
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+    from PIL.Image import Image as PILImage
+
+
+# Worker pools iter_cutouts can run on
+worker_pools = ("process", "thread")
+
+### def_generator that yields one processed cutout at a time, so memory does not grow with the folder size
+### the images are processed ahead by a pool of worker threads (Pillow decode, Open-cv and Blender's scanfill release
+### the GIL), pool="process" uses processes instead, for python without Blender where the earcut triangulation holds the GIL
+### only a couple of cutouts per worker are kept waiting for the main thread to build their meshes
+def iter_cutouts(png_paths: Sequence[str], settings: Settings, workers: int = 0,
+                 profiler: PipelineProfiler = null_profiler, pool: str = "thread") -> Iterator[Cutout]:
+    if pool not in worker_pools:
+        raise ValueError(f"Unknown worker pool {pool!r}, use one of {worker_pools}. iter_cutouts()")
+    if workers < 1:
+        workers = os.cpu_count() or 1
+    opacity_suffix = settings.get("opacity_suffix", "_opc")
+    # Workers only get the clock origin of the profiler, their stages come back with the cutout
+    profile_start = profiler.start_wall if profiler.enabled else None
+    pending = deque()
+
+    with cutout_executor(pool, workers) as executor:
+        try:
+            for png_path in png_paths:
+                ### Condicion evita que un archivo con el sufijo de opacidad sea procesado redundantemente
+                if png_path.endswith(opacity_suffix + ".png"):
+                    continue
+                pending.append(executor.submit(profiled_cutout, png_path, settings, profile_start))
+                if len(pending) >= workers * 2:
+                    yield next_cutout(pending, profiler)
+            while pending:
+                yield next_cutout(pending, profiler)
+        finally:
+            # Mesh creation failed or was stopped, skip the images that did not start yet
+            for future in pending:
+                future.cancel()
+
+### def_pool of worker threads, or of processes when asked and they can start here (a child has to be able to import the
+### script that started it, which is not the case of a script that only runs inside Blender)
+### the first task tells the triangulator of the children, inside Blender they have no scanfill and fall back to earcut
+def cutout_executor(pool: str, workers: int) -> Executor:
+    if pool == "process":
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            worker_triangulator = executor.submit(triangulator_name).result()
+        except (BrokenProcessPool, OSError) as error:
+            executor.shutdown(wait=False, cancel_futures=True)
+            logger.warning("Worker processes could not start (%s), the images are processed in threads", error)
+        else:
+            if worker_triangulator != triangulator_name():
+                logger.warning("Worker processes triangulate with %s instead of %s, threads keep %s",
+                               worker_triangulator, triangulator_name(), triangulator_name())
+            return executor
+    return ThreadPoolExecutor(max_workers=workers)
+
+### def_process_cutout as run by a worker, with a profiler of its own whose stages and counters go back in the cutout
+def profiled_cutout(png_path: str, settings: Settings, profile_start: Optional[float] = None) -> Cutout:
+    if profile_start is None:
+        return process_cutout(png_path, settings)
+    profiler = PipelineProfiler(start_wall=profile_start)
+    cutout = process_cutout(png_path, settings, profiler)
+    cutout["profile"] = (profiler.events, profiler.counters)
+    return cutout
+
+### def_oldest cutout in flight, the time the main thread spends waiting for the workers is profiled as "wait"
+def next_cutout(pending: deque, profiler: PipelineProfiler) -> Cutout:
+    with profiler.stage("wait"):
+        cutout = pending.popleft().result()
+    if "profile" in cutout:
+        profiler.merge(*cutout.pop("profile"))
+    return cutout
+
+### def_takes a single png from decode to scaled contours and extents ready to be turned into a mesh
+### settings holds mesh_height, algorithm, smooth_window, smooth_kernel and optionally holes, alpha_channels_path, cache_path
+### (plain values only, they are sent to the worker processes), the profiler times every stage of the image
+### runs in the workers, it must not touch bpy
+def process_cutout(png_path: str, settings: Settings, profiler: PipelineProfiler = null_profiler) -> Cutout:
+    png_name = os.path.basename(png_path)[:-4]
+    alpha_channels_path = settings.get("alpha_channels_path")
+    cache_path = settings.get("cache_path")
+
+    ### Reads the png once, its bytes are hashed for the cache and then decoded
+    with profiler.stage("read", png_name):
+        with open(png_path, "rb") as png_file:
+            png_mtime = os.fstat(png_file.fileno()).st_mtime
+            png_bytes = png_file.read()
+        file_hash = file_content_hash(png_bytes)
+
+    ### Unchanged image processed with the same settings, skips decoding (debug masks still need the decoded image)
+    if cache_path is not None:
+        cache_key = file_hash + "-" + contour_settings_hash(settings)
+        cache_file = os.path.join(cache_path, png_name + ".npz")
+        if alpha_channels_path is None:
+            with profiler.stage("cache load", png_name):
+                cutout = load_cached_cutout(cache_file, cache_key)
+            if cutout is not None:
+                cutout.update({"name": png_name, "path": png_path, "mtime": png_mtime, "hash": file_hash, "cached": True})
+                with profiler.stage("textures", png_name):
+                    write_cutout_textures(cutout, settings)
+                if settings.get("lod_errors"):
+                    with profiler.stage("lods", png_name):
+                        cutout["lods"] = cutout_lods(cutout, settings["lod_errors"], settings.get("holes", False))
+                return cutout
+
+    ### Alpha channel, written to disk only as a debug mask
+    ### the decoded image is only kept when cropped, atlas or proxy textures are made from it
+    with profiler.stage("decode", png_name):
+        rgba_image = image_rgba(io.BytesIO(png_bytes))
+        del png_bytes
+    with profiler.stage("alpha", png_name):
+        opc_image = np.asarray(rgba_image.getchannel("A"))
+    if settings.get("crop_path") is None and not settings.get("proxy_sizes") and not settings.get("atlas_size"):
+        rgba_image = None
+    if alpha_channels_path is not None:
+        opacity_suffix = settings.get("opacity_suffix", "_opc")
+        save_alpha_mask(opc_image, os.path.join(alpha_channels_path, png_name + opacity_suffix + ".png"))
+
+    ### Computer vision process image into a contour (alpha_channel_to_contour in two stages, both are profiled)
+    with profiler.stage("threshold", png_name):
+        thresh = alpha_channel_threshold(opc_image)
+    dimensions = opc_image.shape
+    del opc_image
+    with profiler.stage("contours", png_name):
+        contours, hierarchy = binary_mask_contours(thresh, settings["algorithm"])
+    del thresh
+    profiler.count("contours", len(contours))
+
+    #Returns a simple (N,4) array with the next, previous, first child and parent of every contour
+    if hierarchy is None:
+        contour_hierarchy = np.empty((0, 4), dtype=np.int32)
+    else:
+        contour_hierarchy = hierarchy[0]
+
+    ### Outlines (and their holes when holes is on) that make the mesh, the contours no polygon uses are left empty
+    ### so they keep their place in the hierarchy while the vertex budget and counts only see what ends in the mesh
+    polygons = contour_polygons(contour_hierarchy, settings.get("holes", False))
+    mesh_contour_indices = {contour_index for polygon in polygons for contour_index in polygon}
+
+    ### Smooths (cyclic rolling average) and places the contours in mesh coordinates as float32 (N,3) arrays
+    img_height, img_width = dimensions[:2]
+    scale_factor = settings["mesh_height"]/img_height
+    with profiler.stage("smoothing", png_name):
+        smoothed_contours = [point_rolling_average(contour, settings["smooth_window"], settings["smooth_kernel"])
+                             if contour_index in mesh_contour_indices else np.empty((0, 3))
+                             for contour_index, contour in enumerate(contours)]
+
+    ### Simplifies the smoothed contours, the error is given in scene units and measured here in pixels
+    with profiler.stage("simplify", png_name):
+        simplify_tolerance = settings.get("simplify_error", 0.0) / scale_factor
+        simplified_contours = simplify_contours_to_budget(smoothed_contours, simplify_tolerance, settings.get("vertex_budget", 0))
+    vertex_counts = (contour_vertex_count(smoothed_contours), contour_vertex_count(simplified_contours))
+
+    with profiler.stage("scaling", png_name):
+        mesh_contours = []
+        for contour in simplified_contours:
+            mesh_contour = image_to_mesh_coordinates(contour, scale_factor, img_height)
+            mesh_contours.append(orient_counterclockwise(mesh_contour))
+
+        ### Pixels of the image that hold the cutout, the rest is transparent margin (used by the atlas)
+        bbox = contour_pixel_bbox(contours, dimensions)
+
+        ### Turns dimensions into image extent vertices 
+        extent_verts = image_to_mesh_coordinates(dim_to_extent_verts(dimensions), scale_factor, img_height)
+
+    ### Triangulates the outlines (with their holes), the main thread only has to write them into a mesh
+    with profiler.stage("triangulate", png_name):
+        mesh_verts, triangles = triangulate_contours(mesh_contours, polygons)
+
+    cutout = {"name": png_name,
+              "path": png_path,
+              "mtime": png_mtime,
+              "hash": file_hash,
+              "cached": False,
+              "dimensions": dimensions,
+              "bbox": bbox,
+              "vertex_counts": vertex_counts,
+              "verts": mesh_contours,
+              "hierarchy": contour_hierarchy,
+              "extents": extent_verts,
+              "mesh_verts": mesh_verts,
+              "triangles": triangles}
+    if cache_path is not None:
+        with profiler.stage("cache save", png_name):
+            save_cached_cutout(cache_file, cache_key, cutout)
+    with profiler.stage("textures", png_name):
+        write_cutout_textures(cutout, settings, rgba_image)
+    if settings.get("lod_errors"):
+        with profiler.stage("lods", png_name):
+            cutout["lods"] = cutout_lods(cutout, settings["lod_errors"], settings.get("holes", False))
+    return cutout
+
+### def_writes the textures made from a cutout: the png cropped to the cutout bbox into crop_path (the extents, so the UVs,
+### are moved onto the bbox) and the downscaled proxies of the texture used, the decoded image is reused when given
+### a cached cutout keeps the textures of a previous run as long as the original png is not newer
+def write_cutout_textures(cutout: Cutout, settings: Settings, rgba_image: Optional[PILImage] = None) -> None:
+    crop_path = settings.get("crop_path")
+    proxy_sizes = settings.get("proxy_sizes", [])
+
+    ### Cutouts that go into an atlas page only send their bbox pixels back to be pasted (see CutoutAtlas), nothing is
+    ### written for them, the pages get their own proxies
+    atlas_size = settings.get("atlas_size", 0)
+    if atlas_size and fits_atlas_page(cutout["bbox"], atlas_size):
+        if rgba_image is None:
+            rgba_image = image_rgba(cutout["path"])
+        cutout["atlas_pixels"] = np.asarray(rgba_image.crop(cutout["bbox"]))
+        return
+
+    texture_path = cutout["path"]
+    if crop_path is not None:
+        texture_path = os.path.join(crop_path, cutout["name"] + ".png")
+        img_height = cutout["dimensions"][0]
+        scale_factor = settings["mesh_height"]/img_height
+        cutout["extents"] = image_to_mesh_coordinates(bbox_extent_verts(cutout["bbox"]), scale_factor, img_height)
+
+    def is_outdated(path: str) -> bool:
+        return not (cutout["cached"] and os.path.exists(path) and os.path.getmtime(path) >= cutout["mtime"])
+
+    write_crop = crop_path is not None and is_outdated(texture_path)
+    outdated_proxy_sizes = [size for size in proxy_sizes if is_outdated(proxy_texture_path(texture_path, size))]
+    if not write_crop and not outdated_proxy_sizes:
+        return
+
+    if rgba_image is None:
+        rgba_image = image_rgba(cutout["path"])
+    texture = rgba_image.crop(cutout["bbox"]) if crop_path is not None else rgba_image
+    if write_crop:
+        texture.save(texture_path)
+    save_proxy_textures(texture, texture_path, outdated_proxy_sizes)
+
+### def_simplified versions of a cutout, made from its mesh contours so nothing is decoded again
+### one (mesh_verts, triangles) pair per tolerance in lod_errors (scene units)
+def cutout_lods(cutout: Cutout, lod_errors: Sequence[float], holes: bool = False) -> List[Tuple[List[ndarray], ndarray]]:
+    polygons = contour_polygons(cutout["hierarchy"], holes)
+    lods = []
+    for lod_error in lod_errors:
+        lod_contours = [orient_counterclockwise(contour) for contour in simplify_contours(cutout["verts"], lod_error)]
+        lods.append(triangulate_contours(lod_contours, polygons))
+    return lods
+
+### def_LOD level for a distance: 0 when closer than first_distance and one level more every time the distance doubles
+def lod_level_for_distance(distance: float, first_distance: float, levels: int) -> int:
+    if levels <= 1 or distance < first_distance:
+        return 0
+    return min(int(math.log2(distance / first_distance)) + 1, levels - 1)
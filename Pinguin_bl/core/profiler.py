@@ -0,0 +1,149 @@
+### Run profiler: wall and cpu time of every pipeline stage per image, plus counters of what was made
+### every worker records into a profiler of its own that is merged into the main one with its cutout (see iter_cutouts),
+### it can be exported as json or as a Chrome trace (chrome://tracing or https://ui.perfetto.dev)
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# One recorded stage
+ProfileEvent = Dict[str, Any]
+
+
+### def_times one stage of one image, wall time with perf_counter and cpu time of the thread running it
+class ProfilerStage:
+    def __init__(self, profiler: PipelineProfiler, stage: str, image: Optional[str]) -> None:
+        self.profiler = profiler
+        self.stage = stage
+        self.image = image
+
+    def __enter__(self) -> ProfilerStage:
+        self.start_wall = time.perf_counter()
+        self.start_cpu = time.thread_time()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.profiler.add_event({"stage": self.stage,
+                                 "image": self.image,
+                                 "process": os.getpid(),
+                                 "thread": threading.get_ident(),
+                                 "start": self.start_wall - self.profiler.start_wall,
+                                 "wall": time.perf_counter() - self.start_wall,
+                                 "cpu": time.thread_time() - self.start_cpu})
+
+### def_stand-in stage of a disabled profiler, nothing is timed nor stored
+class NullProfilerStage:
+    def __enter__(self) -> NullProfilerStage:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+null_profiler_stage = NullProfilerStage()
+
+### def_collects the stages and counters of a conversion run, a disabled profiler costs one method call per stage
+class PipelineProfiler:
+    ### start_wall lets a worker profiler share the clock origin of the main one, perf_counter is the same in every process
+    def __init__(self, enabled: bool = True, start_wall: Optional[float] = None) -> None:
+        self.enabled = enabled
+        self.events: List[ProfileEvent] = []
+        self.counters: Dict[str, int] = {}
+        self.lock = threading.Lock()
+        self.start_wall = time.perf_counter() if start_wall is None else start_wall
+        self.start_cpu = time.process_time()
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        # Summary made by finish, panels redraw from it instead of going through every event again
+        self.finished_summary: Optional[Dict[str, Any]] = None
+
+    ### with profiler.stage("decode", png_name): ...
+    def stage(self, stage: str, image: Optional[str] = None):
+        if not self.enabled:
+            return null_profiler_stage
+        return ProfilerStage(self, stage, image)
+
+    def add_event(self, event: ProfileEvent) -> None:
+        with self.lock:
+            self.events.append(event)
+            self.finished_summary = None
+
+    ### stages and counters recorded by a worker profiler
+    def merge(self, events: List[ProfileEvent], counters: Dict[str, int]) -> None:
+        with self.lock:
+            self.events.extend(events)
+            for counter, amount in counters.items():
+                self.counters[counter] = self.counters.get(counter, 0) + amount
+            self.finished_summary = None
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+            self.finished_summary = None
+
+    ### closes the run, the total wall and cpu time of this process (every thread, worker processes only count in their
+    ### stages) are taken from here and the summary is made once
+    def finish(self) -> None:
+        self.wall_seconds = time.perf_counter() - self.start_wall
+        self.cpu_seconds = time.process_time() - self.start_cpu
+        self.finished_summary = self.summarize()
+
+    ### totals per stage (in the order they first ran) and per image, times in milliseconds
+    ### the one made by finish while nothing was recorded since, otherwise it is made from the events
+    def summary(self) -> Dict[str, Any]:
+        if self.finished_summary is not None:
+            return self.finished_summary
+        return self.summarize()
+
+    def summarize(self) -> Dict[str, Any]:
+        stages: Dict[str, Dict[str, float]] = {}
+        images: Dict[str, Dict[str, float]] = {}
+        for event in self.events:
+            stage_total = stages.setdefault(event["stage"], {"calls": 0, "wall_ms": 0.0, "cpu_ms": 0.0})
+            stage_total["calls"] += 1
+            stage_total["wall_ms"] += event["wall"] * 1000
+            stage_total["cpu_ms"] += event["cpu"] * 1000
+            if event["image"] is not None:
+                image_total = images.setdefault(event["image"], {"wall_ms": 0.0, "cpu_ms": 0.0})
+                image_total["wall_ms"] += event["wall"] * 1000
+                image_total["cpu_ms"] += event["cpu"] * 1000
+        return {"wall_ms": self.wall_seconds * 1000,
+                "cpu_ms": self.cpu_seconds * 1000,
+                "stages": stages,
+                "images": images,
+                "counters": dict(self.counters)}
+
+    ### (image, wall ms) of the images that took the longest, from a summary already at hand or the profiler's own
+    def slowest_images(self, amount: int = 5, summary: Optional[Dict[str, Any]] = None) -> List[tuple]:
+        images = (summary or self.summary())["images"]
+        return sorted(((image, total["wall_ms"]) for image, total in images.items()), key=lambda item: -item[1])[:amount]
+
+    def to_json(self) -> Dict[str, Any]:
+        return dict(self.summary(), events=self.events)
+
+    ### Trace Event Format: one complete ("X") event per stage on the thread that ran it, times in microseconds
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        process_id = os.getpid()
+        trace_events = []
+        for event in self.events:
+            trace_events.append({"name": event["stage"],
+                                 "cat": "pinguin",
+                                 "ph": "X",
+                                 "pid": event.get("process", process_id),
+                                 "tid": event["thread"],
+                                 "ts": round(event["start"] * 1e6, 1),
+                                 "dur": round(event["wall"] * 1e6, 1),
+                                 "args": {"image": event["image"], "cpu_ms": round(event["cpu"] * 1000, 3)}})
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms", "otherData": {"counters": dict(self.counters)}}
+
+    ### writes the profile, chrome_trace picks the Chrome trace format instead of the plain json summary + events
+    def write(self, path: str, chrome_trace: bool = False) -> None:
+        with open(path, "w") as profile_file:
+            json.dump(self.to_chrome_trace() if chrome_trace else self.to_json(), profile_file)
+
+# Used when a run is not profiled
+null_profiler = PipelineProfiler(enabled=False)
@@ -0,0 +1,57 @@
+### Plain python 3d vector math used to face the cutouts towards a target
+from __future__ import annotations
+
+import math
+from typing import List, Sequence, Tuple
+
+Vector3 = Sequence[float]
+
+
+def cross_product_3d(vector1: List[float], vector2: List[float]) -> List[float]:
+    if vector1 == vector2:
+        vector2[2] += 1
+    #### algo oscuro esta pasando aca
+    """
+    print( f"x = {vector1[1]} * {vector2[2]} - {vector1[2]} * {vector2[1]}")
+    print( f"y = {vector1[2]} * {vector2[0]} - {vector1[0]} * {vector2[2]}")
+    print( f"z = {vector1[0]} * {vector2[1]} - {vector1[1]} * {vector2[0]}")
+    """
+    x = vector1[1] * vector2[2] - vector1[2] * vector2[1]
+    y = vector1[2] * vector2[0] - vector1[0] * vector2[2]
+    z = vector1[0] * vector2[1] - vector1[1] * vector2[0]
+    return [x, y, z]
+
+def normalize_vector(vector: Vector3) -> Tuple[float, float, float]:
+    x, y, z = vector
+    magnitude = math.sqrt(x**2 + y**2 + z**2)
+    normalized_vector = (x / magnitude, y / magnitude, z / magnitude)
+    return normalized_vector
+
+def dot_product(vector1: Vector3, vector2: Vector3) -> float:
+    if len(vector1) != len(vector2):
+        raise ValueError("Both vectors must have same number of components. dot_product()")
+    result = 0
+    for i in range(3):
+        result += vector1[i] * vector2[i]
+    return result
+
+def flip_vector(vector: Vector3) -> List[float]:
+    return [-coord for coord in vector]
+
+def project_vector_onto_plane(vector_to_project: Vector3, vector1: List[float], vector2: List[float]) -> List[float]:
+    # Avoids the same vector zero div error given that we 
+    # are always projecting into a vertical plane
+    if vector1 == vector2:
+        vector2[2] += 1
+    # Calculate the normal vector of the plane
+    normal_vector = cross_product_3d(vector1, vector2)
+    # Normalize the normal vector
+    normal_vector_normalized = normalize_vector(normal_vector)
+    
+    dot_product_proj = dot_product(vector_to_project, normal_vector_normalized)
+    #Projected vector = a - dot(a, n) * n
+    projected_vector = []
+    for i in range(len(vector_to_project)): 
+        projected_vector.append(vector_to_project[i] - dot_product_proj * normal_vector_normalized[i])
+        
+    return projected_vector
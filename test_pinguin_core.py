@@ -0,0 +1,364 @@
+import logging
+import os
+import statistics
+
+import numpy as np
+import pytest
+
+import Pinguin_bl.core.contours
+from Pinguin_bl.core import (PipelineProfiler, RateLimitedLog, ShelfPacker, atlas_uv_transform,
+                             contour_hierarchy_levels, contour_pixel_bbox, contour_polygons, contour_settings_hash,
+                             cross_product_3d, cutout_lods, cutout_object_is_current, cutout_settings_hash,
+                             earcut_polygon, image_to_mesh_coordinates, iter_cutouts, load_cached_cutout,
+                             lod_level_for_distance, null_profiler, orient_counterclockwise, point_rolling_average,
+                             process_cutout, prune_cutout_cache, remove_repeated_points, save_cached_cutout,
+                             simplify_contours, simplify_contours_to_budget, triangulate_contours,
+                             write_cutout_textures)
+
+def test_cross_product_3d():
+    vector1 = [1, 2, 3]
+    vector2 = [4, 5, 6]
+    expected_result = [-3, 6, -3]
+    assert cross_product_3d(vector1, vector2) == expected_result
+
+    vector1 = [0, 0, 0]
+    vector2 = [1, 2, 3]
+    expected_result = [0, 0, 0]
+    assert cross_product_3d(vector1, vector2) == expected_result
+
+    vector1 = [2, -3, 1]
+    vector2 = [4, 1, 2]
+    expected_result = [-7, 0, 14]
+    assert cross_product_3d(vector1, vector2) == expected_result
+
+    # Add more test cases as needed
+
+
+### Previous list based implementation, kept as the reference output for window=3
+def legacy_point_rolling_average(points, window=3):
+    window_lists = []
+    for point_co in range(len(points)):
+        window_lists.append(points[0:window])
+        points = points[1:] + points[:1]
+
+    average_points = []
+    for point_window in window_lists:
+        x_values = [point[0] for point in point_window]
+        y_values = [point[1] for point in point_window]
+        z_values = [point[2] if len(point) > 2 else 0 for point in point_window]
+        average_points.append([round(statistics.mean(x_values), 2),
+                               round(statistics.mean(y_values), 2),
+                               round(statistics.mean(z_values), 2)])
+    return average_points
+
+def test_point_rolling_average():
+    square = [[0, 0], [10, 0], [10, 10], [0, 10]]
+    expected_result = [[6.67, 3.33, 0], [6.67, 6.67, 0], [3.33, 6.67, 0], [3.33, 3.33, 0]]
+    assert point_rolling_average(square).tolist() == expected_result
+
+    # Open-cv contours come as (N,1,2) arrays
+    random_contour = np.random.default_rng(7).integers(0, 4000, size=(500, 1, 2))
+    expected_result = legacy_point_rolling_average(random_contour[:, 0].tolist())
+    assert point_rolling_average(random_contour).tolist() == expected_result
+
+    # Contours shorter than the window are averaged with all of their points
+    assert point_rolling_average([[1, 2], [3, 4]], window=5).tolist() == [[2, 3, 0], [2, 3, 0]]
+    assert point_rolling_average(np.empty((0, 1, 2))).shape == (0, 3)
+
+def test_point_rolling_average_gaussian():
+    line = [[x, 0] for x in range(20)]
+    smoothed = point_rolling_average(line, window=5, kernel="GAUSSIAN")
+    assert smoothed.shape == (20, 3)
+    # A symmetric kernel keeps evenly spaced points evenly spaced, shifted half a window forward
+    assert smoothed[0].tolist() == [2, 0, 0]
+    with pytest.raises(ValueError):
+        point_rolling_average(line, kernel="TRIANGLE")
+
+def test_image_to_mesh_coordinates():
+    # Image rows grow downwards, the mesh is mirrored so the top row ends at the mesh height
+    image_points = [[0, 0, 0], [10, 0, 0], [10, 20, 0]]
+    mesh_points = image_to_mesh_coordinates(image_points, 0.5, 20)
+    assert mesh_points.dtype == np.float32
+    assert mesh_points.tolist() == [[0, 10, 0], [5, 10, 0], [5, 0, 0]]
+
+def test_orient_counterclockwise():
+    clockwise_square = np.array([[0, 0, 0], [0, 1, 0], [1, 1, 0], [1, 0, 0]], dtype=np.float32)
+    oriented = orient_counterclockwise(clockwise_square)
+    assert oriented.tolist() == clockwise_square[::-1].tolist()
+    assert orient_counterclockwise(oriented) is oriented
+
+def test_triangulate_contours():
+    clockwise_square = np.array([[0, 0, 0], [0, 2, 0], [2, 2, 0], [2, 0, 0]], dtype=np.float32)
+    line = np.array([[5, 5, 0], [6, 6, 0]], dtype=np.float32)
+    polygons = contour_polygons(np.array([[1, -1, -1, -1], [-1, 0, -1, -1]]))
+    assert polygons == [[0], [1]]
+
+    polygon_contours, triangles = triangulate_contours([clockwise_square, line], polygons)
+    # The two point contour can not enclose anything
+    assert len(polygon_contours) == 1
+    assert triangles.shape == (2, 3)
+    # Every triangle comes back counterclockwise
+    corners = clockwise_square[triangles]
+    edge_b = corners[:, 1] - corners[:, 0]
+    edge_c = corners[:, 2] - corners[:, 0]
+    assert (edge_b[:, 0] * edge_c[:, 1] - edge_b[:, 1] * edge_c[:, 0] > 0).all()
+
+# Open-cv hierarchy rows (next, previous, first child, parent)
+# 0 silhouette, 1 hole in 0, 2 island inside the hole, 3 second silhouette
+nested_hierarchy = np.array([[3, -1, 1, -1],
+                             [-1, -1, 2, 0],
+                             [-1, -1, -1, 1],
+                             [-1, 0, -1, -1]])
+
+def test_earcut_polygon():
+    outline = np.array([[0, 0, 0], [4, 0, 0], [4, 4, 0], [0, 4, 0]], dtype=np.float32)
+    hole = np.array([[1, 1, 0], [1, 3, 0], [3, 3, 0], [3, 1, 0]], dtype=np.float32)
+    triangles = earcut_polygon([outline, hole])
+    assert triangles.shape == (8, 3)
+    # The triangles cover the square minus the hole, nothing more
+    points = np.concatenate([outline, hole])[:, :2]
+    edge_b = points[triangles[:, 1]] - points[triangles[:, 0]]
+    edge_c = points[triangles[:, 2]] - points[triangles[:, 0]]
+    assert np.abs(edge_b[:, 0] * edge_c[:, 1] - edge_b[:, 1] * edge_c[:, 0]).sum() / 2 == 12
+
+def test_triangulate_contours_without_blender(monkeypatch):
+    # Outside Blender there is no scanfill, the bundled earcut triangulates
+    monkeypatch.setattr(Pinguin_bl.core.contours, "blender_scanfill", lambda: None)
+    square = np.array([[0, 0, 0], [2, 0, 0], [2, 2, 0], [0, 2, 0]], dtype=np.float32)
+    hole = np.array([[0.5, 0.5, 0], [0.5, 1.5, 0], [1.5, 1.5, 0], [1.5, 0.5, 0]], dtype=np.float32)
+    polygon_contours, triangles = triangulate_contours([square, hole], [[0, 1]])
+    assert len(polygon_contours) == 2
+    assert triangles.shape == (8, 3)
+
+def test_contour_polygons_with_holes():
+    assert contour_polygons(nested_hierarchy) == [[0], [3]]
+    assert contour_polygons(nested_hierarchy, holes=True) == [[0, 1], [2], [3]]
+
+def test_contour_hierarchy_levels():
+    hierarchy_level_list, level_buckets = contour_hierarchy_levels(nested_hierarchy)
+    assert hierarchy_level_list.tolist() == [0, 1, 2, 0]
+    assert [bucket.tolist() for bucket in level_buckets] == [[0, 3], [1], [2]]
+
+    hierarchy_level_list, level_buckets = contour_hierarchy_levels(np.empty((0, 4)))
+    assert len(hierarchy_level_list) == 0 and level_buckets == []
+
+def test_remove_repeated_points():
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 0, 0], [1, 1, 0], [0, 0, 0]], dtype=np.float32)
+    assert remove_repeated_points(points).tolist() == [[1, 0, 0], [1, 1, 0], [0, 0, 0]]
+
+def test_cutout_object_is_current():
+    # Custom properties of a blender object read like a dict
+    obj = {"pinguin_mtime": 1700000000.5, "pinguin_settings": "a1"}
+    assert cutout_object_is_current(obj, 1700000000.5, "a1")
+    assert not cutout_object_is_current(obj, 1700000001.0, "a1")
+    assert not cutout_object_is_current(obj, 1700000000.5, "b2")
+    assert not cutout_object_is_current(None, 1700000000.5, "a1")
+
+def test_cached_cutout_roundtrip(tmp_path):
+    square = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=np.float32)
+    cutout = {"dimensions": (10, 20),
+              "bbox": (2, 1, 18, 9),
+              "vertex_counts": (7, 7),
+              "verts": [square, square[:3] + 2],
+              "hierarchy": np.array([[1, -1, -1, -1], [-1, 0, -1, -1]]),
+              "extents": np.zeros((4, 3), dtype=np.float32),
+              "mesh_verts": [],
+              "triangles": np.empty((0, 3), dtype=np.int32)}
+    cache_file = str(tmp_path / "cutout.npz")
+    save_cached_cutout(cache_file, "key", cutout)
+
+    assert load_cached_cutout(cache_file, "other key") is None
+    cached_cutout = load_cached_cutout(cache_file, "key")
+    assert cached_cutout["dimensions"] == (10, 20)
+    assert cached_cutout["bbox"] == (2, 1, 18, 9)
+    assert [contour.tolist() for contour in cached_cutout["verts"]] == [contour.tolist() for contour in cutout["verts"]]
+    assert cached_cutout["verts"][0].dtype == np.float32
+    assert cached_cutout["mesh_verts"] == []
+    assert cached_cutout["hierarchy"].tolist() == cutout["hierarchy"].tolist()
+
+def test_prune_cutout_cache(tmp_path):
+    for cache_name in ("kept.npz", "renamed.npz", "crashed.npz.tmp", "notes.txt"):
+        (tmp_path / cache_name).write_bytes(b"")
+    assert prune_cutout_cache(str(tmp_path), [str(tmp_path / "kept.png"), str(tmp_path / "new name.png")]) == 2
+    assert sorted(os.listdir(tmp_path)) == ["kept.npz", "notes.txt"]
+
+def test_cutout_settings_hash():
+    settings = {"mesh_height": 1.0, "algorithm": {"CHAIN_APPROX_SIMPLE"}, "smooth_window": 3, "smooth_kernel": "BOX"}
+    assert cutout_settings_hash(settings) == cutout_settings_hash(dict(settings, holes=False))
+    assert cutout_settings_hash(settings) != cutout_settings_hash(dict(settings, smooth_window=5))
+    # LODs are made again after a cache load, they only change the objects
+    assert contour_settings_hash(settings) == contour_settings_hash(dict(settings, lod_errors=[0.005]))
+    assert cutout_settings_hash(settings) != cutout_settings_hash(dict(settings, lod_errors=[0.005]))
+    assert contour_settings_hash(settings) == contour_settings_hash(dict(settings, crop_path="Cropped"))
+    assert cutout_settings_hash(settings) != cutout_settings_hash(dict(settings, crop_path="Cropped"))
+    # Proxies and atlas only change the textures and UVs of the objects
+    assert contour_settings_hash(settings) == contour_settings_hash(dict(settings, proxy_sizes=[512], atlas_size=4096))
+    assert cutout_settings_hash(settings) != cutout_settings_hash(dict(settings, proxy_sizes=[512]))
+    assert cutout_settings_hash(settings) != cutout_settings_hash(dict(settings, atlas_size=4096))
+
+def test_shelf_packer():
+    packer = ShelfPacker(100, 100, padding=2)
+    rects = []
+    for width, height in [(40, 30), (40, 20), (50, 30), (98, 10), (10, 10)]:
+        x, y = packer.insert(width, height)
+        assert x + width <= 100 and y + height <= 100
+        rects.append((x, y, x + width, y + height))
+    for index, (ax0, ay0, ax1, ay1) in enumerate(rects):
+        for bx0, by0, bx1, by1 in rects[index + 1:]:
+            assert ax1 <= bx0 or bx1 <= ax0 or ay1 <= by0 or by1 <= ay0
+    assert packer.insert(101, 10) is None
+    assert packer.insert(90, 60) is None
+
+def test_atlas_uv_transform():
+    # 200x100 image whose cutout covers x 50-150 and y 20-80, copied at x=10, y=30 of a 1000 pixels page
+    scale, offset = atlas_uv_transform((100, 200), (50, 20, 150, 80), (10, 30), 1000)
+    bottom_left = np.array([50 / 200, 1 - 80 / 100]) * scale + offset
+    top_right = np.array([150 / 200, 1 - 20 / 100]) * scale + offset
+    assert bottom_left == pytest.approx([10 / 1000, 1 - 90 / 1000])
+    assert top_right == pytest.approx([110 / 1000, 1 - 30 / 1000])
+
+def test_contour_pixel_bbox():
+    contours = [np.array([[[10, 5]], [[20, 5]], [[20, 15]]]), np.array([[[12, 7]], [[98, 48]]])]
+    assert contour_pixel_bbox(contours, (50, 100)) == (8, 3, 100, 50)
+    assert contour_pixel_bbox([], (50, 100)) == (0, 0, 100, 50)
+
+def test_simplify_contours():
+    # Square with 10 points per side, only the corners matter
+    side = np.linspace(0, 10, 10, endpoint=False)
+    square = np.concatenate([np.column_stack((side, np.zeros(10))), np.column_stack((np.full(10, 10), side)),
+                             np.column_stack((10 - side, np.full(10, 10))), np.column_stack((np.zeros(10), 10 - side))])
+    square = np.column_stack((square, np.zeros(40)))
+    triangle = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float64)
+
+    simplified = simplify_contours([square, triangle], 0.1)
+    assert len(simplified[0]) == 4 and simplified[0].shape[1] == 3
+    assert simplified[1] is triangle
+    assert simplify_contours([square], 0)[0] is square
+
+def test_simplify_contours_to_budget():
+    angles = np.linspace(0, 2 * np.pi, 400, endpoint=False)
+    circle = np.column_stack((np.cos(angles) * 100, np.sin(angles) * 100, np.zeros(400)))
+    assert len(simplify_contours_to_budget([circle], 0.0)[0]) == 400
+    simplified = simplify_contours_to_budget([circle], 0.01, vertex_budget=40)
+    assert 20 < len(simplified[0]) <= 40
+
+    # Tiny contours collapse to a triangle instead of coming back whole, more tolerance never means more points
+    rng = np.random.default_rng(3)
+    specks = [np.column_stack((rng.uniform(0, 1.5, (8, 2)), np.zeros(8))) for _ in range(30)]
+    vertex_counts = [sum(len(contour) for contour in simplify_contours(specks, tolerance)) for tolerance in (0.5, 1, 2, 4)]
+    assert vertex_counts == sorted(vertex_counts, reverse=True)
+    simplified = simplify_contours_to_budget(specks + [circle], 0.01, vertex_budget=150)
+    assert len(simplified) == 31 and sum(len(contour) for contour in simplified) <= 150
+
+def test_cutout_lods():
+    angles = np.linspace(0, 2 * np.pi, 400, endpoint=False)
+    circle = np.column_stack((np.cos(angles), np.sin(angles), np.zeros(400))).astype(np.float32)
+    cutout = {"verts": [circle], "hierarchy": np.array([[-1, -1, -1, -1]])}
+    lods = cutout_lods(cutout, [0.001, 0.01, 0.1])
+    lod_vertex_counts = [sum(len(contour) for contour in lod_verts) for lod_verts, lod_triangles in lods]
+    assert lod_vertex_counts == sorted(lod_vertex_counts, reverse=True) and lod_vertex_counts[-1] < 20
+    assert all(len(lod_triangles) for lod_verts, lod_triangles in lods)
+
+def test_write_cutout_textures_atlas(tmp_path):
+    pytest.importorskip("PIL")
+    from PIL import Image
+    rgba = np.zeros((64, 64, 4), dtype=np.uint8)
+    rgba[10:30, 20:50] = 255
+    png_path = str(tmp_path / "cutout.png")
+    Image.fromarray(rgba).save(png_path)
+    cutout = {"name": "cutout", "path": png_path, "mtime": 0.0, "cached": False, "bbox": (20, 10, 50, 30),
+              "dimensions": (64, 64, 4)}
+
+    # Packed cutouts only hand their pixels over, no per png proxy is written for them
+    write_cutout_textures(cutout, {"mesh_height": 1.0, "proxy_sizes": [16], "atlas_size": 128})
+    assert cutout["atlas_pixels"].shape == (20, 30, 4) and (cutout["atlas_pixels"] == 255).all()
+    assert sorted(os.listdir(tmp_path)) == ["cutout.png"]
+
+    # Larger than a page, it keeps its own texture and proxies
+    cutout.pop("atlas_pixels")
+    write_cutout_textures(cutout, {"mesh_height": 1.0, "proxy_sizes": [16], "atlas_size": 16})
+    assert "atlas_pixels" not in cutout and sorted(os.listdir(tmp_path)) == ["Proxies", "cutout.png"]
+
+@pytest.mark.parametrize("holes", [False, True])
+def test_process_cutout_vertex_budget(tmp_path, holes):
+    cv = pytest.importorskip("cv2")
+    pytest.importorskip("PIL")
+    # A disc with a row of small holes, without holes only the outline makes the mesh
+    rgba = np.zeros((256, 256, 4), dtype=np.uint8)
+    cv.circle(rgba, (128, 128), 100, (255, 255, 255, 255), -1)
+    for hole in range(8):
+        cv.circle(rgba, (80 + hole * 14, 128), 4, (0, 0, 0, 0), -1)
+    png_path = str(tmp_path / "disc.png")
+    cv.imwrite(png_path, rgba)
+    settings = {"mesh_height": 1.0, "algorithm": {"NONE"}, "smooth_window": 3, "smooth_kernel": "BOX",
+                "holes": holes, "vertex_budget": 200}
+
+    cutout = process_cutout(png_path, settings)
+    mesh_vertices = sum(len(contour) for contour in cutout["mesh_verts"])
+    assert cutout["vertex_counts"][1] == mesh_vertices <= 200
+
+@pytest.mark.parametrize("pool", ["process", "thread"])
+def test_iter_cutouts(tmp_path, pool):
+    cv = pytest.importorskip("cv2")
+    pytest.importorskip("PIL")
+    png_paths = []
+    for png_name, radius in (("small", 10), ("large", 25)):
+        rgba = np.zeros((64, 64, 4), dtype=np.uint8)
+        cv.circle(rgba, (32, 32), radius, (255, 255, 255, 255), -1)
+        png_paths.append(str(tmp_path / (png_name + ".png")))
+        cv.imwrite(png_paths[-1], rgba)
+    settings = {"mesh_height": 1.0, "algorithm": {"SIMPLE"}, "smooth_window": 3, "smooth_kernel": "BOX"}
+
+    profiler = PipelineProfiler()
+    cutouts = list(iter_cutouts(png_paths, settings, workers=2, profiler=profiler, pool=pool))
+    assert [cutout["name"] for cutout in cutouts] == ["small", "large"]
+    assert all(len(cutout["triangles"]) and "profile" not in cutout for cutout in cutouts)
+    # The stages of the workers end up in the main profiler
+    summary = profiler.summary()
+    assert summary["stages"]["decode"]["calls"] == 2 and summary["counters"]["contours"] == 2
+    assert set(summary["images"]) == {"small", "large"}
+
+def test_lod_level_for_distance():
+    assert [lod_level_for_distance(distance, 10, 4) for distance in (5, 10, 19, 20, 40, 1000)] == [0, 1, 1, 2, 3, 3]
+    assert lod_level_for_distance(1000, 10, 1) == 0
+
+def test_pipeline_profiler():
+    profiler = PipelineProfiler()
+    for image in ("a", "b"):
+        with profiler.stage("decode", image):
+            sum(range(10000))
+        profiler.count("contours", 3)
+    with profiler.stage("organize"):
+        pass
+    profiler.finish()
+
+    summary = profiler.summary()
+    # Made once by finish, redraws read the same summary
+    assert profiler.summary() is summary and len(profiler.slowest_images(summary=summary)) == 2
+    assert list(summary["stages"]) == ["decode", "organize"]
+    assert summary["stages"]["decode"]["calls"] == 2
+    assert set(summary["images"]) == {"a", "b"} and summary["counters"] == {"contours": 6}
+    trace_events = profiler.to_chrome_trace()["traceEvents"]
+    assert len(trace_events) == 3 and all(event["ph"] == "X" and event["dur"] >= 0 for event in trace_events)
+
+    # A disabled profiler records nothing
+    with null_profiler.stage("decode", "a"):
+        null_profiler.count("contours")
+    assert null_profiler.events == [] and null_profiler.counters == {}
+
+def test_rate_limited_log(caplog):
+    test_logger = logging.getLogger("pinguin.test")
+    item_log = RateLimitedLog(test_logger, interval=60)
+    with caplog.at_level(logging.INFO, logger="pinguin.test"):
+        for index in range(100):
+            item_log(logging.INFO, "converted", "%s converted", index)
+        item_log(logging.INFO, "removed", "%s removed", "old")
+    assert [record.getMessage() for record in caplog.records] == ["0 converted", "old removed"]
+    assert item_log.skipped == {"converted": 99}
+    assert item_log.skipped_summary() == "99 converted"
+
+    # Below the logger level nothing is counted either
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger="pinguin.test"):
+        item_log(logging.INFO, "converted", "%s converted", 100)
+    assert caplog.records == [] and item_log.skipped == {"converted": 99}
@@ -1,4 +1,4 @@
-from Pinguin_bl import cross_product_3d
+from Pinguin_bl.core import cross_product_3d
 import math
 
 def main():
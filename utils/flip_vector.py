@@ -1,4 +1,4 @@
-from Pinguin_bl import flip_vector
+from Pinguin_bl.core import flip_vector
 
 vector = [-4,-92,25]
 
@@ -0,0 +1,70 @@
+### Compares the nesting level computation of the hole mode on synthetic deeply nested masks
+### Run it with: blender -b -P utils/hierarchy_benchmark.py (or any python with numpy + opencv and the Pinguin_bl package importable)
+import os
+import sys
+import time
+
+import cv2 as cv
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Pinguin_bl.core import contour_hierarchy_levels
+
+### def_concentric rings, every ring is one level deeper than the previous one
+def nested_rings_mask(rings, ring_width=3):
+    size = rings * ring_width * 2 + 10
+    mask = np.zeros((size, size), dtype=np.uint8)
+    for ring in range(rings):
+        radius = (rings - ring) * ring_width
+        cv.circle(mask, (size // 2, size // 2), radius, 255 if ring % 2 == 0 else 0, -1)
+    return mask
+
+### def_grid of small nested ring groups, like halftone dots or text
+def halftone_mask(dots_per_side, rings_per_dot):
+    dot = nested_rings_mask(rings_per_dot)
+    return np.tile(dot, (dots_per_side, dots_per_side))
+
+### def_previous implementation, walks from every contour up to the root, O(n * depth)
+def legacy_hierarchy_levels(contour_parents):
+    hierarchy_level_list = []
+    for parent_index in range(len(contour_parents)):
+        cpl_parent = contour_parents[parent_index]
+        hierarchy_level = 0
+        while cpl_parent != -1:
+            parent_index = cpl_parent
+            cpl_parent = contour_parents[parent_index]
+            hierarchy_level += 1
+        hierarchy_level_list.append(hierarchy_level)
+    ### Rescans the levels once per fill level
+    for fill_level in set(hierarchy_level_list):
+        [index for index, level in enumerate(hierarchy_level_list) if level == fill_level]
+    return hierarchy_level_list
+
+def time_ms(function, *args, repeat=5):
+    best_time = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function(*args)
+        best_time = min(best_time, time.perf_counter() - start_time)
+    return best_time * 1000
+
+def main():
+    masks = {"nested rings x200": nested_rings_mask(200),
+             "nested rings x800": nested_rings_mask(800),
+             "halftone 40x40 dots x6": halftone_mask(40, 6)}
+
+    print(f"{'mask':<24}{'contours':>10}{'depth':>8}{'legacy ms':>12}{'single pass ms':>16}")
+    for mask_name, mask in masks.items():
+        contours, hierarchy = cv.findContours(mask, cv.RETR_TREE, cv.CHAIN_APPROX_SIMPLE)
+        hierarchy = hierarchy[0]
+        contour_parents = hierarchy[:, 3].tolist()
+
+        hierarchy_level_list, level_buckets = contour_hierarchy_levels(hierarchy)
+        assert hierarchy_level_list.tolist() == legacy_hierarchy_levels(contour_parents)
+
+        legacy_ms = time_ms(legacy_hierarchy_levels, contour_parents)
+        single_pass_ms = time_ms(contour_hierarchy_levels, hierarchy)
+        print(f"{mask_name:<24}{len(contours):>10}{len(level_buckets):>8}{legacy_ms:>12.2f}{single_pass_ms:>16.2f}")
+
+if __name__ == "__main__":
+    main()
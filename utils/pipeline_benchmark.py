@@ -0,0 +1,210 @@
+### Times every stage of the bpy-free pipeline on a synthetic corpus of cutouts and checks it against a saved baseline
+### Run it with: blender -b -P utils/pipeline_benchmark.py -- [options] (or any python with numpy, opencv and Pillow)
+###   python utils/pipeline_benchmark.py --save-baseline baseline.json      # on the reference commit
+###   python utils/pipeline_benchmark.py --baseline baseline.json --threshold 10   # exits with 1 on a regression
+### Every cutout goes through Pinguin_bl.core's own process_cutout, its stages are read from the pipeline profiler
+### and every case runs in a process of its own so the peak memory belongs to that case alone
+### Baselines hold absolute timings, only compare runs made on the same machine
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import cv2 as cv
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Pinguin_bl.core import PipelineProfiler, process_cutout
+
+try:
+    import resource
+except ImportError: # Windows
+    resource = None
+
+shapes = ["blobs", "text", "rings", "noisy"]
+stages = ["read", "decode", "alpha", "threshold", "contours", "smoothing", "simplify", "scaling", "triangulate"]
+# 8192 can be asked with --sizes, outside Blender its triangulation (pure python earcut) takes minutes
+default_sizes = [256, 1024, 4096]
+# Written into the baselines, a baseline of another version has other stages or cases and is not compared
+baseline_version = 3
+mesh_height = 1.7
+
+### CORPUS ###
+# Every mask comes from a generator seeded with the shape and size, so the corpus is the same on every run
+
+### def_overlapping filled ellipses, a few large silhouettes
+def blobs_mask(size, rng):
+    mask = np.zeros((size, size), dtype=np.uint8)
+    for _ in range(12):
+        center = tuple(int(value) for value in rng.integers(size // 4, size * 3 // 4, 2))
+        axes = tuple(int(value) for value in rng.integers(size // 16, size // 5, 2))
+        cv.ellipse(mask, center, axes, float(rng.uniform(0, 180)), 0, 360, 255, -1)
+    return mask
+
+### def_lines of letters, many small contours with holes
+def text_mask(size, rng):
+    mask = np.zeros((size, size), dtype=np.uint8)
+    letters = np.array(list("ABDOPQRabdegopq0689"))
+    line_height = max(size // 16, 12)
+    font_scale = line_height / 30
+    for line_top in range(line_height, size - line_height // 2, line_height):
+        line = "".join(rng.choice(letters, 24))
+        cv.putText(mask, line, (line_height // 2, line_top), cv.FONT_HERSHEY_SIMPLEX, font_scale, 255,
+                   max(1, line_height // 12), cv.LINE_AA)
+    return mask
+
+### def_concentric rings, every ring is one level deeper than the previous one
+def rings_mask(size, rng):
+    mask = np.zeros((size, size), dtype=np.uint8)
+    ring_width = max(size // 128, 2)
+    for ring in range(size // 2 // ring_width - 1):
+        radius = size // 2 - (ring + 1) * ring_width
+        cv.circle(mask, (size // 2, size // 2), radius, 255 if ring % 2 == 0 else 0, -1)
+    return mask
+
+### def_a single silhouette with a ragged border, long contours and lots of specks around it
+def noisy_mask(size, rng):
+    mask = np.zeros((size, size), dtype=np.uint8)
+    cv.circle(mask, (size // 2, size // 2), size * 3 // 8, 255, -1)
+    kernel = np.ones((max(size // 64, 3),) * 2, dtype=np.uint8)
+    border = cv.dilate(mask, kernel) != cv.erode(mask, kernel)
+    noise = rng.integers(0, 256, (size, size), dtype=np.uint8)
+    mask[border] = np.where(noise[border] > 127, 255, 0)
+    return mask
+
+shape_masks = {"blobs": blobs_mask, "text": text_mask, "rings": rings_mask, "noisy": noisy_mask}
+
+### def_encodes the mask as the alpha of an RGBA png, with a coarse random color so the png does not compress to nothing
+def synthetic_png(shape, size):
+    rng = np.random.default_rng([shapes.index(shape), size])
+    alpha = shape_masks[shape](size, rng)
+    color = cv.resize(rng.integers(0, 256, (max(size // 32, 2),) * 2 + (3,), dtype=np.uint8), (size, size),
+                      interpolation=cv.INTER_LINEAR)
+    ok, png = cv.imencode(".png", np.dstack((color, alpha)))
+    if not ok:
+        raise RuntimeError(f"Could not encode the {shape} {size} cutout. synthetic_png()")
+    return png.tobytes()
+
+### MEASUREMENTS ###
+
+### def_peak resident memory of this process in MB, None where the resource module does not exist
+### main runs every case in a fresh process, so it is the peak of that case (plus the interpreter and its imports)
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on linux, bytes on macOS
+    return peak_rss / 1024 ** 2 if sys.platform == "darwin" else peak_rss / 1024
+
+### def_settings of a plain conversion with holes and simplification, no cache, textures nor lods
+def benchmark_settings(simplify_error):
+    return {"mesh_height": mesh_height,
+            "algorithm": {"SIMPLE"},
+            "smooth_window": 3,
+            "smooth_kernel": "BOX",
+            "holes": True,
+            "simplify_error": simplify_error}
+
+### def_runs process_cutout once, returns the ms of every stage and the vertex count of the smoothed contours
+def time_stages(png_path, simplify_error=0.0):
+    profiler = PipelineProfiler()
+    cutout = process_cutout(png_path, benchmark_settings(simplify_error), profiler)
+    stage_totals = profiler.summary()["stages"]
+    stage_ms = {stage: stage_totals[stage]["wall_ms"] if stage in stage_totals else 0.0 for stage in stages}
+    return stage_ms, cutout["vertex_counts"][0]
+
+### def_best time of every stage over the repeats, like the other benchmarks the minimum is the least noisy figure
+def benchmark_case(png_path, repeat, simplify_error=0.0):
+    # Pillow and Open-cv are imported by the first run (see Pinguin_bl/core/lazy.py), it is not timed
+    time_stages(png_path, simplify_error)
+    best_ms = None
+    for _ in range(repeat):
+        stage_ms, vertices = time_stages(png_path, simplify_error)
+        best_ms = stage_ms if best_ms is None else {stage: min(best_ms[stage], stage_ms[stage]) for stage in stages}
+    total_ms = sum(best_ms.values())
+    return {"stages_ms": {stage: round(best_ms[stage], 3) for stage in stages},
+            "total_ms": round(total_ms, 3),
+            "vertices": vertices,
+            "vertices_per_second": round(vertices / (total_ms / 1000), 1) if total_ms else 0.0,
+            "peak_rss_mb": peak_rss_mb()}
+
+### def_writes the cutout of a case into a png, generates it in a fresh process and returns its result
+def run_case(shape, size, repeat, simplify_error, work_path):
+    png_path = os.path.join(work_path, f"{shape}_{size}.png")
+    with open(png_path, "wb") as png_file:
+        png_file.write(synthetic_png(shape, size))
+    command = [sys.executable, os.path.abspath(__file__), "--case", png_path,
+               "--repeat", str(repeat), "--simplify", str(simplify_error)]
+    case_output = subprocess.run(command, check=True, stdout=subprocess.PIPE, text=True).stdout
+    return json.loads(case_output.strip().splitlines()[-1])
+
+### def_cases slower than the baseline by more than threshold percent, as (case, baseline, current, change %)
+def throughput_regressions(results, baseline, threshold):
+    regressions = []
+    for case_name, result in results.items():
+        baseline_case = baseline.get("cases", {}).get(case_name)
+        if not baseline_case or not baseline_case["vertices_per_second"]:
+            continue
+        change = (result["vertices_per_second"] / baseline_case["vertices_per_second"] - 1) * 100
+        if change < -threshold:
+            regressions.append((case_name, baseline_case["vertices_per_second"], result["vertices_per_second"], change))
+    return regressions
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="pipeline_benchmark", description="Times the cutout pipeline stages on a synthetic corpus")
+    parser.add_argument("--sizes", type=int, nargs="+", default=default_sizes, help="side of the square cutouts in pixels")
+    parser.add_argument("--shapes", nargs="+", choices=shapes, default=shapes)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per cutout, the best one is kept")
+    parser.add_argument("--simplify", type=float, default=0.002, help="simplification distance in scene units, 0 skips it")
+    parser.add_argument("--baseline", help="json written by --save-baseline to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed throughput loss in percent")
+    parser.add_argument("--save-baseline", help="writes the results as json")
+    parser.add_argument("--case", help=argparse.SUPPRESS) # one png, run by main in its own process
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    args = parse_args(argv)
+    if args.case:
+        print(json.dumps(benchmark_case(args.case, args.repeat, args.simplify)))
+        return 0
+
+    results = {}
+    print(f"{'cutout':<14}{'vertices':>10}" + "".join(f"{stage:>14}" for stage in stages)
+          + f"{'total ms':>12}{'verts/s':>14}{'peak MB':>10}")
+    with tempfile.TemporaryDirectory(prefix="pinguin_benchmark_") as work_path:
+        for size in args.sizes:
+            for shape in args.shapes:
+                case_name = f"{shape} {size}"
+                result = run_case(shape, size, args.repeat, args.simplify, work_path)
+                results[case_name] = result
+                peak_rss = "-" if result["peak_rss_mb"] is None else f"{result['peak_rss_mb']:.0f}"
+                print(f"{case_name:<14}{result['vertices']:>10}"
+                      + "".join(f"{result['stages_ms'][stage]:>14.2f}" for stage in stages)
+                      + f"{result['total_ms']:>12.2f}{result['vertices_per_second']:>14.0f}{peak_rss:>10}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as baseline_file:
+            json.dump({"version": baseline_version, "repeat": args.repeat, "simplify": args.simplify, "cases": results}, baseline_file, indent=2)
+        print("Baseline written to", args.save_baseline)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get("version") != baseline_version:
+            print(f"{args.baseline} was saved by version {baseline.get('version')} of the benchmark, this is version "
+                  f"{baseline_version}: save a new baseline on the reference commit")
+            return 1
+        regressions = throughput_regressions(results, baseline, args.threshold)
+        for case_name, baseline_throughput, throughput, change in regressions:
+            print(f"REGRESSION {case_name}: {baseline_throughput:.0f} -> {throughput:.0f} vertices/s ({change:+.1f}%)")
+        if regressions:
+            return 1
+        print(f"No case lost more than {args.threshold}% of its baseline throughput")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
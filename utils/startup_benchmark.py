@@ -0,0 +1,55 @@
+### Measures how much Pinguin adds to Blender's startup
+### Run it with: blender -b --factory-startup -P utils/startup_benchmark.py
+import importlib
+import os
+import sys
+import time
+
+budget_ms = 50
+heavy_modules = ["PIL.Image", "cv2", "numpy"]
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def time_ms(function):
+    start_time = time.perf_counter()
+    result = function()
+    return (time.perf_counter() - start_time) * 1000, result
+
+def import_and_register():
+    if "Pinguin_bl" in sys.modules:
+        module = importlib.reload(sys.modules["Pinguin_bl"])
+    else:
+        module = importlib.import_module("Pinguin_bl")
+    module.register()
+    return module
+
+def main():
+    preloaded = [name for name in heavy_modules if name in sys.modules]
+
+    ### 1. Lazy - import + register() exactly as Blender does it at startup
+    lazy_ms, pinguin = time_ms(import_and_register)
+    loaded_by_register = [name for name in heavy_modules if name in sys.modules and name not in preloaded]
+    pinguin.unregister()
+
+    ### 2. Eager - what the add-on cost when Pillow, Open-cv and Numpy were imported at module level
+    heavy_import_ms = {}
+    for module_name in heavy_modules:
+        heavy_import_ms[module_name], _ = time_ms(lambda: importlib.import_module(module_name))
+    eager_register_ms, pinguin = time_ms(import_and_register)
+    pinguin.unregister()
+    eager_ms = eager_register_ms + sum(heavy_import_ms.values())
+
+    print("\n🐧 Pinguin startup benchmark 🐧")
+    print(f"import + register() lazy:  {lazy_ms:8.2f} ms (budget {budget_ms} ms)")
+    print(f"import + register() eager: {eager_ms:8.2f} ms")
+    for module_name, module_ms in heavy_import_ms.items():
+        note = " (already imported by Blender)" if module_name in preloaded else ""
+        print(f"    {module_name:<10} {module_ms:8.2f} ms{note}")
+    if loaded_by_register:
+        print("Heavy modules imported during register():", ", ".join(loaded_by_register))
+
+    if lazy_ms > budget_ms or loaded_by_register:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()